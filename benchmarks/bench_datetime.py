@@ -0,0 +1,38 @@
+"""
+Microbenchmark Of Timestamp Parsing
+
+Usage: python -m benchmarks.bench_datetime
+"""
+import timeit
+
+import dateutil.parser
+
+from soundcld.resource.datetimes import parse_datetime
+
+
+def main() -> None:
+    unique = [f'2024-{m:02d}-{d:02d}T{h:02d}:{d:02d}:{m:02d}Z'
+              for m in range(1, 13) for d in range(1, 29) for h in range(24)]
+    repeated = unique[:50] * 20
+    runs = 5
+
+    def cold():
+        parse_datetime.cache_clear()
+        for value in unique:
+            parse_datetime(value)
+
+    print(f'{len(unique)} unique timestamps, {len(repeated)} repeated timestamps')
+    for name, values in (('unique', unique), ('repeated', repeated)):
+        slow = min(timeit.repeat(lambda: [dateutil.parser.isoparse(v) for v in values],
+                                 number=runs, repeat=3)) / runs / len(values)
+        if name == 'unique':
+            fast = min(timeit.repeat(cold, number=runs, repeat=3)) / runs / len(values)
+        else:
+            fast = min(timeit.repeat(lambda: [parse_datetime(v) for v in values],
+                                     number=runs, repeat=3)) / runs / len(values)
+        print(f'{name:9}: dateutil {slow * 1e6:6.2f} us, parse_datetime {fast * 1e6:6.2f} us, '
+              f'{slow / fast:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
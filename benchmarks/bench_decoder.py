@@ -0,0 +1,44 @@
+"""
+Benchmark Of Precompiled Decoders Against dacite.from_dict
+
+Usage: python -m benchmarks.bench_decoder
+"""
+import json
+import os
+import timeit
+
+from dacite import from_dict
+
+from soundcld.resource import BasicTrack
+
+PAYLOAD = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'tracks_page.json')
+
+
+def load_page(size: int = 200) -> list:
+    with open(PAYLOAD, 'r', encoding='utf-8') as file:
+        collection = json.load(file)['collection']
+    return [collection[i % len(collection)] for i in range(size)]
+
+
+def main() -> None:
+    page = load_page()
+    config = BasicTrack.dacite_config
+    assert [from_dict(BasicTrack, item, config) for item in page] == \
+           [BasicTrack.from_dict(item) for item in page]
+
+    runs = 20
+    dacite_time = min(timeit.repeat(
+        lambda: [from_dict(BasicTrack, item, config) for item in page],
+        number=runs, repeat=3)) / runs
+    compiled_time = min(timeit.repeat(
+        lambda: [BasicTrack.from_dict(item) for item in page],
+        number=runs, repeat=3)) / runs
+
+    print(f'page of {len(page)} BasicTrack')
+    print(f'dacite.from_dict    : {dacite_time * 1000:8.2f} ms/page')
+    print(f'compiled decoder    : {compiled_time * 1000:8.2f} ms/page')
+    print(f'speedup             : {dacite_time / compiled_time:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
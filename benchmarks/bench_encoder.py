@@ -0,0 +1,60 @@
+"""
+Benchmark Of Precompiled Encoders Against Generic items() Recursion
+
+Usage: python -m benchmarks.bench_encoder
+"""
+import json
+import timeit
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+
+from soundcld.resource import BasicTrack
+
+from benchmarks.bench_decoder import load_page
+
+
+def generic_dict(value):
+    """
+    Conversion Which items() Did Before Encoders, Kept For Comparison
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return {f.name: generic_dict(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, (list, tuple)):
+        return [generic_dict(v) for v in value]
+    return value
+
+
+def main() -> None:
+    tracks = [BasicTrack.from_dict(item) for item in load_page()]
+    assert [generic_dict(track) for track in tracks] == [track.to_dict() for track in tracks]
+
+    runs = 20
+    generic_time = min(timeit.repeat(
+        lambda: [generic_dict(track) for track in tracks],
+        number=runs, repeat=3)) / runs
+    compiled_time = min(timeit.repeat(
+        lambda: [track.to_dict() for track in tracks],
+        number=runs, repeat=3)) / runs
+    skip_time = min(timeit.repeat(
+        lambda: [track.to_dict(skip_none=True) for track in tracks],
+        number=runs, repeat=3)) / runs
+    generic_json = min(timeit.repeat(
+        lambda: [json.dumps(generic_dict(track)) for track in tracks],
+        number=runs, repeat=3)) / runs
+    compiled_json = min(timeit.repeat(
+        lambda: [track.to_json() for track in tracks],
+        number=runs, repeat=3)) / runs
+
+    print(f'page of {len(tracks)} BasicTrack')
+    print(f'generic recursion   : {generic_time * 1000:8.2f} ms/page')
+    print(f'to_dict()           : {compiled_time * 1000:8.2f} ms/page')
+    print(f'to_dict(skip_none)  : {skip_time * 1000:8.2f} ms/page')
+    print(f'speedup             : {generic_time / compiled_time:8.1f}x')
+    print(f'generic + json.dumps: {generic_json * 1000:8.2f} ms/page')
+    print(f'to_json()           : {compiled_json * 1000:8.2f} ms/page')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Memory Benchmark Of Slotted And Plain Resource Classes
+
+Usage: python -m benchmarks.bench_slotted_memory
+"""
+import gc
+import tracemalloc
+
+from soundcld.resource import BasicTrack
+from soundcld.resource.slotted import SlottedBasicTrack
+
+from benchmarks.bench_decoder import load_page
+
+COUNT = 100_000
+
+
+def measure(data_class, page: list) -> int:
+    gc.collect()
+    tracemalloc.start()
+    tracks = [data_class.from_dict(page[i % len(page)]) for i in range(COUNT)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tracks
+    return size
+
+
+def main() -> None:
+    page = load_page()
+    plain = measure(BasicTrack, page)
+    compact = measure(SlottedBasicTrack, page)
+    print(f'{COUNT} decoded BasicTrack')
+    print(f'plain   : {plain / 2 ** 20:8.1f} MiB')
+    print(f'slotted : {compact / 2 ** 20:8.1f} MiB')
+    print(f'saved   : {(1 - compact / plain) * 100:8.1f} %')
+
+
+if __name__ == '__main__':
+    main()
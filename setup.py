@@ -18,6 +18,12 @@ setup(
         'dev': [
             'pytest'
         ],
+        'async': [
+            'aiohttp'
+        ],
+        'fast': [
+            'orjson'
+        ],
     },
     classifiers=[
         'Programming Language :: Python :: 3',
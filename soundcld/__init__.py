@@ -1,11 +1,20 @@
 """
 SoundCld Is Soundcloud-v2 api handler
 """
+from collections import Counter
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 import soundcld.resource
 from .api_handler import BaseSound
+from .async_api_handler import AsyncBaseSound
+from .request_handler import collection_options
+from .resource.slotted import SlottedMiniTrack
+
+__all__ = ['SoundCloud', 'AsyncSoundCloud', 'collection_options']
+
+_MINI_TRACKS = (soundcld.resource.MiniTrack, SlottedMiniTrack)
 
 
 class SoundCloud(BaseSound):
@@ -221,16 +230,16 @@ class SoundCloud(BaseSound):
         link = f'/tracks/{track_id}'
         return self._get_track(link)
 
-    def get_tracks(self, track_ids: List[int]):
+    def get_tracks(self, track_ids: List[int], batch_size: int = None, max_workers: int = None):
         """
-        Get Multiple Tracks By Track IDs
+        Get Multiple Tracks By Track IDs.
+        IDs Are Requested In Batches Of batch_size (Default 50),
+        Up To max_workers Batches At Once. Tracks Are Returned
+        In Order Of IDs, IDs Not Found Are In Result's missing,
+        IDs Of Batches Whose Request Failed Are In Its failed.
         """
         link = '/tracks'
-        param = {
-            'ids': ','.join([str(its) for its in track_ids]),
-            '%5Bobject%20Object%5D': ''
-        }
-        return self._get_track_list(link, **param)
+        return self._get_track_batches(link, track_ids, batch_size, max_workers)
 
     def get_track_liker(self, track_id: int):
         """
@@ -289,6 +298,44 @@ class SoundCloud(BaseSound):
         link = f'/playlists/{playlist_id}'
         return self._get_album_playlist(link)
 
+    def hydrate_playlist(self, playlists, batch_size: int = None, max_workers: int = None):
+        """
+        Replaces MiniTrack Stubs Of Playlist (Or List Of Playlists)
+        With Full Tracks. Stub IDs Of All Playlists Are Deduplicated,
+        Tracks Already Present Or Cached Are Reused And The Rest Are
+        Fetched In Batches Like get_tracks. Order Of Tracks Is Kept,
+        Stubs Of Deleted Tracks Stay As They Are.
+        """
+        items = [playlists] if not isinstance(playlists, (list, tuple)) else list(playlists)
+        found, stub_ids = self._playlist_stubs(items)
+        if stub_ids:
+            tracks = self._get_track_batches('/tracks', stub_ids, batch_size, max_workers)
+            found.update((track.id, track) for track in tracks)
+        hydrated = [self._hydrated_playlist(playlist, found) for playlist in items]
+        return hydrated if isinstance(playlists, (list, tuple)) else hydrated[0]
+
+    def _playlist_stubs(self, playlists) -> Tuple[Dict[int, object], List[int]]:
+        found = {}
+        stub_ids = []
+        for playlist in playlists:
+            for track in playlist.tracks:
+                if not isinstance(track, _MINI_TRACKS):
+                    found[track.id] = track
+        for playlist in playlists:
+            for track in playlist.tracks:
+                if isinstance(track, _MINI_TRACKS) and track.id not in found:
+                    cached = self._get_cached_track(f'/tracks/{track.id}')
+                    if cached is not None:
+                        found[track.id] = cached
+                    else:
+                        stub_ids.append(track.id)
+        return found, list(dict.fromkeys(stub_ids))
+
+    @staticmethod
+    def _hydrated_playlist(playlist, found: Dict[int, object]):
+        tracks = tuple(found.get(track.id, track) for track in playlist.tracks)
+        return replace(playlist, tracks=tracks)
+
     def get_playlist_liker(self, playlist_id: int):
         """
         Get Playlist's Liker Users By Playlist ID
@@ -660,19 +707,24 @@ class SoundCloud(BaseSound):
         """
         link = '/me'
         last_info = self.get_user(self.my_account_id)
-        payload = {
-            'city': city,
-            'country_code': country_code,
-            'description': description,
-            'first_name': first_name,
-            'last_name': last_name,
-            'permalink': permalink,
-            'username': username
-        }
+        payload = self._profile_payload(
+            last_info,
+            city=city,
+            country_code=country_code,
+            description=description,
+            first_name=first_name,
+            last_name=last_name,
+            permalink=permalink,
+            username=username
+        )
+        return self._put_payload(link, **payload)
+
+    @staticmethod
+    def _profile_payload(last_info, **payload) -> dict:
         for item, value in payload.items():
             if not value:
                 payload[item] = last_info[item]
-        return self._put_payload(link, **payload)
+        return payload
 
     def like_track(self, track_id: int):
         """
@@ -702,6 +754,104 @@ class SoundCloud(BaseSound):
         link = f'/users/{self.my_account_id}/playlist_likes/{playlist_id}'
         return self._delete_payload(link)
 
+    def like_tracks(self, track_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Likes Many Tracks by Me {Logged-In User}.
+        Returns Success Per Track ID.
+        """
+        links = {track_id: f'/users/{self.my_account_id}/track_likes/{track_id}' for track_id in track_ids}
+        return self._bulk_payload('PUT', links, max_workers)
+
+    def like_playlists(self, playlist_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Likes Many Playlists or Albums by Me {Logged-In User}.
+        Returns Success Per Playlist ID.
+        """
+        links = {
+            playlist_id: f'/users/{self.my_account_id}/playlist_likes/{playlist_id}'
+            for playlist_id in playlist_ids
+        }
+        return self._bulk_payload('PUT', links, max_workers)
+
+    def dislike_tracks(self, track_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Dislikes Many Tracks by Me {Logged-In User}.
+        Returns Success Per Track ID.
+        """
+        links = {track_id: f'/users/{self.my_account_id}/track_likes/{track_id}' for track_id in track_ids}
+        return self._bulk_payload('DELETE', links, max_workers)
+
+    def dislike_playlists(self, playlist_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Dislikes Many Playlists or Albums by Me {Logged-In User}.
+        Returns Success Per Playlist ID.
+        """
+        links = {
+            playlist_id: f'/users/{self.my_account_id}/playlist_likes/{playlist_id}'
+            for playlist_id in playlist_ids
+        }
+        return self._bulk_payload('DELETE', links, max_workers)
+
+    def repost_track(self, track_id: int):
+        """
+        Reposts The Track by Me {Logged-In User}.
+        """
+        link = f'/me/track_reposts/{track_id}'
+        return self._put_payload(link)
+
+    def repost_playlist(self, playlist_id: int):
+        """
+        Reposts The Playlist or Album by Me {Logged-In User}.
+        """
+        link = f'/me/playlist_reposts/{playlist_id}'
+        return self._put_payload(link)
+
+    def unrepost_track(self, track_id: int):
+        """
+        Removes Repost Of The Track by Me {Logged-In User}.
+        """
+        link = f'/me/track_reposts/{track_id}'
+        return self._delete_payload(link)
+
+    def unrepost_playlist(self, playlist_id: int):
+        """
+        Removes Repost Of The Playlist or Album by Me {Logged-In User}.
+        """
+        link = f'/me/playlist_reposts/{playlist_id}'
+        return self._delete_payload(link)
+
+    def repost_tracks(self, track_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Reposts Many Tracks by Me {Logged-In User}.
+        Returns Success Per Track ID.
+        """
+        links = {track_id: f'/me/track_reposts/{track_id}' for track_id in track_ids}
+        return self._bulk_payload('PUT', links, max_workers)
+
+    def unrepost_tracks(self, track_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Removes Reposts Of Many Tracks by Me {Logged-In User}.
+        Returns Success Per Track ID.
+        """
+        links = {track_id: f'/me/track_reposts/{track_id}' for track_id in track_ids}
+        return self._bulk_payload('DELETE', links, max_workers)
+
+    def repost_playlists(self, playlist_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Reposts Many Playlists or Albums by Me {Logged-In User}.
+        Returns Success Per Playlist ID.
+        """
+        links = {playlist_id: f'/me/playlist_reposts/{playlist_id}' for playlist_id in playlist_ids}
+        return self._bulk_payload('PUT', links, max_workers)
+
+    def unrepost_playlists(self, playlist_ids: Iterable[int], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Removes Reposts Of Many Playlists or Albums by Me {Logged-In User}.
+        Returns Success Per Playlist ID.
+        """
+        links = {playlist_id: f'/me/playlist_reposts/{playlist_id}' for playlist_id in playlist_ids}
+        return self._bulk_payload('DELETE', links, max_workers)
+
     def create_playlist(
             self,
             playlist_name: str,
@@ -741,21 +891,7 @@ class SoundCloud(BaseSound):
         """
         Adds Track Or List Of Tracks To The Playlist by Me {Logged-In User}.
         """
-        link = f'/playlists/{playlist_id}'
-        temp_playlist = self.get_playlist(playlist_id)
-        temp_tracks = []
-        for item in temp_playlist.tracks:
-            temp_tracks.append(item.id)
-        if isinstance(track_id, int):
-            temp_tracks.append(track_id)
-        else:
-            temp_tracks.extend(track_id)
-        payload = {
-            'playlist': {
-                'tracks': temp_tracks
-            }
-        }
-        return self._put_payload(link, **payload)
+        return self.edit_playlist_tracks(playlist_id, add=track_id)
 
     def remove_track_from_playlist(
             self,
@@ -765,22 +901,71 @@ class SoundCloud(BaseSound):
         """
         Removes Track Or List Of Tracks To The Playlist by Me {Logged-In User}.
         """
+        return self.edit_playlist_tracks(playlist_id, remove=track_id)
+
+    def edit_playlist_tracks(
+            self,
+            playlist_id: int,
+            add: Union[int, List[int]] = None,
+            remove: Union[int, List[int]] = None,
+            order: List[int] = None
+    ) -> bool:
+        """
+        Adds, Removes And Reorders Tracks Of The Playlist by Me {Logged-In User}
+        In One Request. Playlist Is Re-Read From Server Without Decoding Before
+        Edit (Bypassing Response Cache), So Changes Made Elsewhere Are Kept.
+
+        :param playlist_id: The ID Of Playlist
+        :param add: Track ID Or IDs Appended To Playlist
+        :param remove: Track ID Or IDs Removed From Playlist (One Entry Per ID)
+        :param order: Track IDs Moved To Start Of Playlist In Given Order
+        """
         link = f'/playlists/{playlist_id}'
-        temp_playlist = self.get_playlist(playlist_id)
-        temp_tracks = []
-        for item in temp_playlist.tracks:
-            temp_tracks.append(item.id)
-        if isinstance(track_id, int):
-            temp_tracks.remove(track_id)
+        state = self._get_playlist_state(playlist_id)
+        if state is None:
+            return False
+        track_ids = self._edited_track_ids(state.track_ids, add, remove, order)
+        return self._put_payload(link, playlist={'tracks': track_ids})
+
+    @staticmethod
+    def _edited_track_ids(
+            track_ids: List[int],
+            add: Union[int, List[int]] = None,
+            remove: Union[int, List[int]] = None,
+            order: List[int] = None
+    ) -> List[int]:
+        if isinstance(remove, int):
+            remove = [remove]
+        if remove:
+            counts = Counter(remove)
+            kept = []
+            for track_id in track_ids:
+                if counts[track_id]:
+                    counts[track_id] -= 1
+                else:
+                    kept.append(track_id)
+            track_ids = kept
         else:
-            for item in track_id:
-                temp_tracks.remove(item)
-        payload = {
-            'playlist': {
-                'tracks': temp_tracks
-            }
-        }
-        return self._put_payload(link, **payload)
+            track_ids = list(track_ids)
+        if isinstance(add, int):
+            track_ids.append(add)
+        elif add:
+            track_ids.extend(add)
+        if order:
+            available = Counter(track_ids)
+            front = []
+            for track_id in order:
+                if available[track_id]:
+                    available[track_id] -= 1
+                    front.append(track_id)
+            moved = Counter(front)
+            for track_id in track_ids:
+                if moved[track_id]:
+                    moved[track_id] -= 1
+                else:
+                    front.append(track_id)
+            track_ids = front
+        return track_ids
 
     def edit_playlist_info(
             self,
@@ -806,7 +991,9 @@ class SoundCloud(BaseSound):
         :param permalink: The Link Name Of Playlist
         """
         link = f'/playlists/{playlist_id}'
-        playlist_temp_data = self.get_playlist(playlist_id)
+        state = self._get_playlist_state(playlist_id)
+        if state is None:
+            return False
         payload = {
             'title': title,
             'description': description,
@@ -816,30 +1003,163 @@ class SoundCloud(BaseSound):
             'tag_list': tag,
             'permalink': permalink
         }
+        temp_dict = self._playlist_info_payload(playlist_id, state, payload)
+        if temp_dict is None:
+            return
+        return self._put_payload(link, **temp_dict)
+
+    @staticmethod
+    def _playlist_info_payload(playlist_id: int, state, payload: dict):
         temp_dict = {}
-        for item, value in playlist_temp_data.items():
+        for item, value in state.data.items():
             temp_dict[item] = value
         for item, value in payload.items():
             if value:
                 temp_dict[item] = value
                 if item == 'permalink':
-                    temp_link = playlist_temp_data['permalink_url'].split('/')
+                    temp_link = state.data['permalink_url'].split('/')
                     temp_link[-1] = temp_dict[item]
                     temp_dict['permalink_url'] = '/'.join(temp_link)
                 elif item == 'kind':
-                    if not (temp_dict['release_date'] or payload['release_date']):
+                    if not (temp_dict.get('release_date') or payload['release_date']):
                         print('release_date not added')
-                        return
+                        return None
                     if value != 'playlist':
                         temp_dict['set_type'] = value
                     else:
                         temp_dict['set_type'] = None
-        some_arr = []
-        for item in playlist_temp_data.tracks:
-            some_arr.append(item.id)
         now = datetime.utcnow()
         temp_dict['last_modified'] = f'{now.isoformat().split(".")[0]}Z'
-        temp_dict['tracks'] = some_arr
+        temp_dict['tracks'] = list(state.track_ids)
         temp_dict['_resource_id'] = playlist_id
-        temp_dict['_resource_type'] = playlist_temp_data.kind
-        return self._put_payload(link, **temp_dict)
+        temp_dict['_resource_type'] = state.kind
+        return temp_dict
+
+
+class AsyncSoundCloud(AsyncBaseSound, SoundCloud):
+    """
+    The Main SoundCloud Class With Non-Blocking Requests.
+    Has The Same Methods As SoundCloud, Single Resources
+    Must Be Awaited And Collections Are Async Iterators.
+    """
+    # pylint: disable=invalid-overridden-method
+
+    async def get_web_profiles(self, user_id: int):
+        """
+        Get User's WebProfiles Users By User ID
+        """
+        if not user_id and await self.is_logged_in():
+            user_id = self.my_account_id
+        link = f'/users/soundcloud:users:{user_id}/web-profiles'
+        return await self._get_web_profile_list(link)
+
+    async def change_my_profile_info(
+            self,
+            permalink: str = None,
+            username: str = None,
+            city: str = None,
+            country_code: str = None,
+            description: str = None,
+            first_name: str = None,
+            last_name: str = None
+    ):
+        """
+        Changes My {Logged-In User} Information.
+        """
+        link = '/me'
+        last_info = await self.get_user(self.my_account_id)
+        payload = self._profile_payload(
+            last_info,
+            city=city,
+            country_code=country_code,
+            description=description,
+            first_name=first_name,
+            last_name=last_name,
+            permalink=permalink,
+            username=username
+        )
+        return await self._put_payload(link, **payload)
+
+    async def hydrate_playlist(self, playlists, batch_size: int = None, max_workers: int = None):
+        """
+        Replaces MiniTrack Stubs Of Playlist (Or List Of Playlists)
+        With Full Tracks, See SoundCloud.hydrate_playlist.
+        """
+        items = [playlists] if not isinstance(playlists, (list, tuple)) else list(playlists)
+        found, stub_ids = self._playlist_stubs(items)
+        if stub_ids:
+            tracks = await self._get_track_batches('/tracks', stub_ids, batch_size, max_workers)
+            found.update((track.id, track) for track in tracks)
+        hydrated = [self._hydrated_playlist(playlist, found) for playlist in items]
+        return hydrated if isinstance(playlists, (list, tuple)) else hydrated[0]
+
+    async def add_track_to_playlist(
+            self,
+            playlist_id: int,
+            track_id: Union[int, List[int]]
+    ):
+        """
+        Adds Track Or List Of Tracks To The Playlist by Me {Logged-In User}.
+        """
+        return await self.edit_playlist_tracks(playlist_id, add=track_id)
+
+    async def remove_track_from_playlist(
+            self,
+            playlist_id: int,
+            track_id: Union[int, List[int]]
+    ):
+        """
+        Removes Track Or List Of Tracks To The Playlist by Me {Logged-In User}.
+        """
+        return await self.edit_playlist_tracks(playlist_id, remove=track_id)
+
+    async def edit_playlist_tracks(
+            self,
+            playlist_id: int,
+            add: Union[int, List[int]] = None,
+            remove: Union[int, List[int]] = None,
+            order: List[int] = None
+    ) -> bool:
+        """
+        Adds, Removes And Reorders Tracks Of The Playlist by Me {Logged-In User}
+        In One Request. See SoundCloud.edit_playlist_tracks For Parameters.
+        """
+        link = f'/playlists/{playlist_id}'
+        state = await self._get_playlist_state(playlist_id)
+        if state is None:
+            return False
+        track_ids = self._edited_track_ids(state.track_ids, add, remove, order)
+        return await self._put_payload(link, playlist={'tracks': track_ids})
+
+    async def edit_playlist_info(
+            self,
+            playlist_id: int,
+            title: str = None,
+            description: str = None,
+            playlist_type: str = None,
+            release_date: str = None,
+            genre: str = None,
+            tag: str = None,
+            permalink: str = None
+    ):
+        """
+        Changes The Playlist Info by Me {Logged-In User}.
+        See SoundCloud.edit_playlist_info For Parameters.
+        """
+        link = f'/playlists/{playlist_id}'
+        state = await self._get_playlist_state(playlist_id)
+        if state is None:
+            return False
+        payload = {
+            'title': title,
+            'description': description,
+            'kind': playlist_type,
+            'release_date': release_date,
+            'genre': genre,
+            'tag_list': tag,
+            'permalink': permalink
+        }
+        temp_dict = self._playlist_info_payload(playlist_id, state, payload)
+        if temp_dict is None:
+            return
+        return await self._put_payload(link, **temp_dict)
@@ -4,22 +4,33 @@ Api Handler Of SoundCld
 import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from functools import wraps
-from typing import List, Union, Iterator
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, List, Optional, Sequence, Set, Union, Iterator
 
 import requests
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
 
+from soundcld.cache import PreflightCache, ResponseCache
+from soundcld.ratelimit import RateLimiter
 from soundcld.request_handler import (
     GetReq,
+    RawGetReq,
     ListGetReq,
     CollectionGetReq,
     PutReq,
     DeleteReq,
     PostReq
 )
+from soundcld.resource.identity import IdentityMap
+from soundcld.singleflight import SingleFlight
+from soundcld.state import StateStore
 from soundcld.resource import (
     SearchItem, Like, RepostItem, StreamItem,
     Comment, BasicComment,
@@ -37,6 +48,73 @@ cookieDirectory = scriptDirectory + '/cookies.json'
 headerDirectory = scriptDirectory + '/headers.json'
 
 
+class TrackList(list):
+    """
+    Tracks In Order Of Requested IDs,
+    missing Holds IDs Which Were Not Returned (Deleted Or Private),
+    failed Holds IDs Of Batches Whose Request Failed (Worth Retrying)
+    """
+
+    def __init__(self, tracks=(), missing=(), failed=()):
+        super().__init__(tracks)
+        self.missing = list(missing)
+        self.failed = list(failed)
+
+
+@dataclass
+class PlaylistState:
+    """
+    Undecoded Playlist Data With Its Track IDs,
+    Used To Edit Playlist Without Decoding It
+    """
+    id: int
+    kind: str
+    last_modified: str
+    track_ids: List[int]
+    data: dict
+
+    @classmethod
+    def from_raw(cls, data: dict) -> 'PlaylistState':
+        """
+        Builds State From Raw Playlist JSON
+        """
+        return cls(
+            id=data['id'],
+            kind=data['kind'],
+            last_modified=data['last_modified'],
+            track_ids=[track['id'] for track in data['tracks']],
+            data=data
+        )
+
+
+def _parse_validate_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _chunks(items: list, size: int) -> List[list]:
+    return [items[index:index + size] for index in range(0, len(items), size)]
+
+
+def _order_tracks(track_ids: List[int], found: Dict[int, BasicTrack], failed: Set[int] = frozenset()) -> TrackList:
+    tracks = []
+    missing = []
+    failed_ids = []
+    for track_id in track_ids:
+        track = found.get(int(track_id))
+        if track is not None:
+            tracks.append(track)
+        elif int(track_id) in failed:
+            failed_ids.append(track_id)
+        else:
+            missing.append(track_id)
+    return TrackList(tracks, missing, failed_ids)
+
+
 def update_cookies_after(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -59,35 +137,80 @@ class BaseSound:
     cookies: dict = None
     headers: dict = None
 
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    keep_alive: bool = True
+    prefetch: int = 0
+    slotted: bool = False
+    lazy_models: bool = False
+    identity_map_size: int = 0
+    cache: ResponseCache = None
+    coalesce: bool = True
+    batch_size: int = 50
+    max_workers: int = 4
+    rate_limiter: RateLimiter = None
+    preflight_ttl: float = 300
+    api_base: str = None
+    lazy: bool = False
+    login_ttl: float = 60
+    write_delay: float = 1.0
+    state_dir: str = None
+
     def __post_init__(self) -> None:
         self.data = {}
         oauth_key = ''
+        self.session = self.__get_session()
+        self.cookie_lock = threading.RLock()
+        self.client_id_lock = threading.RLock()
+        self._refreshing_client_id = False
+        self._last_validate = None
+        self._login_valid_until = 0.0
+        self._login_loaded = False
+        self.identity_map = None
+        if self.identity_map_size:
+            self.identity_map = IdentityMap(self.identity_map_size)
+        self.inflight = SingleFlight() if self.coalesce else None
+        self.preflights = PreflightCache(self.preflight_ttl) if self.preflight_ttl else None
+        self.__get_stores()
         self.__get_conf_last()
         if self.auth:
             self.__get_cookies()
             oauth_key = self.cookies['oauth_token']
         self.__get_headers(oauth_key=oauth_key)
+        if self.lazy:
+            return
         if not self.data['client_id']:
             self.generate_client_id()
         while not self.is_client_id_valid() and self.auto_id_gen:
             self.generate_client_id()
         self.__set_conf_last()
 
+    def __get_stores(self) -> None:
+        state_dir = self.state_dir or os.environ.get('SOUNDCLD_STATE_DIR')
+        conf_path, cookie_path = confDirectory, cookieDirectory
+        if state_dir:
+            state_dir = os.path.expanduser(state_dir)
+            os.makedirs(state_dir, exist_ok=True)
+            conf_path = os.path.join(state_dir, 'data.json')
+            cookie_path = os.path.join(state_dir, 'cookies.json')
+        self.conf_store = StateStore(conf_path, self.write_delay)
+        self.cookie_store = StateStore(cookie_path, self.write_delay)
+
     def __get_conf_last(self) -> None:
-        if os.path.exists(confDirectory):
-            with open(confDirectory, 'r', encoding='utf-8') as file:
-                config = json.load(file)
+        if self.conf_store.exists():
+            config = self.conf_store.load()
             self.data['user_id'] = config['user_id']
             self.data['client_id'] = config['client_id']
             self.data['app_version'] = config['app_version']
+            self._last_validate = _parse_validate_time(config.get('last_validate'))
         else:
             dump_json = {
                 'user_id': None,
                 'client_id': None,
                 'app_version': None
             }
-            with open(confDirectory, 'w', encoding='utf-8') as file:
-                json.dump(dump_json, file, indent=4)
+            self.conf_store.update(dump_json)
+            self.conf_store.flush()
             self.__get_conf_last()
             print('There Is No Data File')
 
@@ -97,23 +220,23 @@ class BaseSound:
             'client_id': self.data['client_id'],
             'app_version': self.data['app_version'],
         }
-        with open(confDirectory, 'w', encoding='utf-8') as file:
-            json.dump(config, file, indent=4)
+        if self._last_validate is not None:
+            config['last_validate'] = self._last_validate.isoformat()
+        self.conf_store.update(config)
 
     def _update_cookies(self):
-        cookie = {
-            'moe_uuid': self.cookies['moe_uuid'],
-            'oauth_token': self.cookies['oauth_token'],
-            'sc_anonymous_id': self.cookies['sc_anonymous_id'],
-            'datadome': self.cookies['datadome']
-        }
-        with open(cookieDirectory, 'w', encoding='utf-8') as file:
-            json.dump(cookie, file, indent=4)
+        with self.cookie_lock:
+            cookie = {
+                'moe_uuid': self.cookies['moe_uuid'],
+                'oauth_token': self.cookies['oauth_token'],
+                'sc_anonymous_id': self.cookies['sc_anonymous_id'],
+                'datadome': self.cookies['datadome']
+            }
+        self.cookie_store.update(cookie)
 
     def __get_cookies(self) -> None:
-        if os.path.exists(cookieDirectory):
-            with open(cookieDirectory, 'r', encoding='utf-8') as file:
-                self.cookies = json.load(file)
+        if self.cookie_store.exists():
+            self.cookies = self.cookie_store.load()
             if self.cookies['oauth_token']:
                 temp = self.cookies['oauth_token'].split('-')
                 self.my_account_id = temp[2]
@@ -123,8 +246,8 @@ class BaseSound:
                 'oauth_token': None,
                 'sc_anonymous_id': None
             }
-            with open(cookieDirectory, 'w', encoding='utf-8') as file:
-                json.dump(dump_json, file, indent=4)
+            self.cookie_store.update(dump_json)
+            self.cookie_store.flush()
             self.__get_cookies()
             print('There Is No Data In Cookies File')
 
@@ -143,62 +266,259 @@ class BaseSound:
         else:
             print('There Is No Headers File')
 
+    def __get_session(self) -> requests.Session:
+        session = requests.Session()
+        # Cookies Are Sent From self.cookies Only, Session Jar Keeps None
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends Request Over Client's Pooled Session
+        With Current Cookies And Headers
+        """
+        with self.cookie_lock:
+            headers = dict(kwargs.pop('headers', self.headers) or {})
+            if 'cookies' not in kwargs:
+                kwargs['cookies'] = dict(self.cookies) if self.cookies else self.cookies
+        if not self.keep_alive:
+            headers['Connection'] = 'close'
+        kwargs.setdefault('timeout', 20)
+        limiter = self.rate_limiter
+        if limiter is None:
+            resp = self.session.request(method, url, headers=headers, **kwargs)
+        else:
+            resp = self._limited_request(limiter, method, url, headers=headers, **kwargs)
+        if self.cookies:
+            with self.cookie_lock:
+                for name in resp.cookies.keys():
+                    if name in self.cookies:
+                        self.cookies[name] = resp.cookies[name]
+        return resp
+
+    def _limited_request(self, limiter: RateLimiter, method: str, url: str, **kwargs) -> requests.Response:
+        attempt = 0
+        while True:
+            time.sleep(limiter.wait(url))
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = limiter.retry_delay(method, url, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = limiter.retry_delay(
+                    method, url, attempt, resp.status_code, resp.headers.get('Retry-After')
+                )
+                if delay is None:
+                    return resp
+                resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """
+        Writes Pending Config Changes And
+        Closes Pooled Connections Of Client
+        """
+        self.flush()
+        self.session.close()
+
+    def flush(self) -> None:
+        """
+        Writes Pending Changes Of data.json And cookies.json
+        """
+        self.conf_store.flush()
+        self.cookie_store.flush()
+
     def _get_user(self, req: str) -> User:
         return GetReq[User](self, req, User)()
 
-    def _get_users(self, req: str, **param) -> Iterator[User]:
-        return CollectionGetReq[User](self, req, User)(**param)
+    def _get_users(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[User]:
+        return CollectionGetReq[User](self, req, User, raw=raw, fields=fields)(**param)
 
     def _get_track(self, req: str) -> BasicTrack:
         return GetReq[BasicTrack](self, req, BasicTrack)()
 
+    def _get_cached_track(self, req: str) -> BasicTrack:
+        return GetReq[BasicTrack](self, req, BasicTrack).cached()
+
     def _get_track_list(self, req: str, **param) -> List[BasicTrack]:
         return ListGetReq[BasicTrack](self, req, BasicTrack)(**param)
 
-    def _get_tracks(self, req: str, **param) -> Iterator[BasicTrack]:
-        return CollectionGetReq[BasicTrack](self, req, BasicTrack)(**param)
+    def _get_tracks(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[BasicTrack]:
+        return CollectionGetReq[BasicTrack](self, req, BasicTrack, raw=raw, fields=fields)(**param)
+
+    def _get_track_batches(
+            self,
+            req: str,
+            track_ids: List[int],
+            batch_size: int = None,
+            max_workers: int = None
+    ) -> TrackList:
+        """
+        Fetches Tracks In Batches Of IDs, Batches Run Concurrently.
+        IDs Of Batches Whose Request Failed Go To Result's failed.
+        """
+        batches = _chunks(list(dict.fromkeys(track_ids)), batch_size or self.batch_size)
+        workers = min(max_workers or self.max_workers, len(batches))
+
+        def load(batch: List[int]) -> Optional[List[BasicTrack]]:
+            try:
+                return self._get_track_batch(req, batch)
+            except requests.RequestException as err:
+                print(f'Something Went Wrong. Batch Of {len(batch)} Tracks Failed: {err}')
+                return None
+
+        if workers <= 1:
+            results = [load(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(load, batches))
+        found = {}
+        failed = set()
+        for batch, tracks in zip(batches, results):
+            if tracks is None:
+                failed.update(int(track_id) for track_id in batch)
+                continue
+            for track in tracks:
+                if track is not None:
+                    found[track.id] = track
+        return _order_tracks(track_ids, found, failed)
+
+    def _get_track_batch(self, req: str, track_ids: List[int]) -> List[BasicTrack]:
+        param = {
+            'ids': ','.join([str(its) for its in track_ids]),
+            '%5Bobject%20Object%5D': ''
+        }
+        return self._get_track_list(req, **param)
 
     def _get_album_playlist(self, req: str) -> BasicAlbumPlaylist:
         return GetReq[BasicAlbumPlaylist](self, req, BasicAlbumPlaylist)()
 
-    def _get_album_playlists(self, req: str) -> Iterator[BasicAlbumPlaylist]:
-        return CollectionGetReq[BasicAlbumPlaylist](self, req, BasicAlbumPlaylist)()
+    def _get_raw(self, req: str, fresh: bool = False, **param) -> dict:
+        return RawGetReq(self, req, fresh=fresh)(**param)
 
-    def _get_likes(self, req: str, **param) -> Iterator[Like]:
-        return CollectionGetReq[Like](self, req, Like)(**param)
+    def _get_playlist_state(self, playlist_id: int) -> Optional[PlaylistState]:
+        """
+        Reads Playlist From Server (Bypassing Response Cache) Without
+        Decoding Tracks. Edits Always Start From This State,
+        So Changes Made Elsewhere Are Not Overwritten.
+        """
+        data = self._get_raw(f'/playlists/{playlist_id}', fresh=True)
+        if not data or 'tracks' not in data:
+            return None
+        return PlaylistState.from_raw(data)
+
+    def _get_album_playlists(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None
+    ) -> Iterator[BasicAlbumPlaylist]:
+        return CollectionGetReq[BasicAlbumPlaylist](self, req, BasicAlbumPlaylist, raw=raw, fields=fields)()
+
+    def _get_likes(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[Like]:
+        return CollectionGetReq[Like](self, req, Like, raw=raw, fields=fields)(**param)
 
     def _get_resolve(self, resolve_link: str):
         return GetReq[SearchItem](self, '/resolve', SearchItem)(url=resolve_link)
 
-    def _get_searches(self, req: str, **param) -> Iterator[SearchItem]:
+    def _get_searches(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[SearchItem]:
         param['user_id'] = self.data['user_id']
-        return CollectionGetReq[SearchItem](self, req, SearchItem)(**param)
-
-    def _get_reposts(self, req: str, **param) -> Iterator[StreamItem]:
-        return CollectionGetReq[StreamItem](self, req, StreamItem)(**param)
-
-    def _get_streams(self, req: str, **param) -> Iterator[RepostItem]:
-        return CollectionGetReq[RepostItem](self, req, RepostItem)(**param)
-
-    def _get_comments(self, req: str, **param) -> Iterator[Comment]:
-        return CollectionGetReq[Comment](self, req, Comment)(**param)
-
-    def _get_basic_comments(self, req: str, **param) -> Iterator[BasicComment]:
-        return CollectionGetReq[BasicComment](self, req, BasicComment)(**param)
+        return CollectionGetReq[SearchItem](self, req, SearchItem, raw=raw, fields=fields)(**param)
+
+    def _get_reposts(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[RepostItem]:
+        return CollectionGetReq[RepostItem](self, req, RepostItem, raw=raw, fields=fields)(**param)
+
+    def _get_streams(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[StreamItem]:
+        return CollectionGetReq[StreamItem](self, req, StreamItem, raw=raw, fields=fields)(**param)
+
+    def _get_comments(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[Comment]:
+        return CollectionGetReq[Comment](self, req, Comment, raw=raw, fields=fields)(**param)
+
+    def _get_basic_comments(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Iterator[BasicComment]:
+        return CollectionGetReq[BasicComment](self, req, BasicComment, raw=raw, fields=fields)(**param)
 
     def _get_id_list(self, req: str, **param) -> List:
         if self.is_logged_in():
             return ListGetReq[int](self, req, int)(**param)
         return ['Not Logged in']
 
-    def _get_conversations(self, req: str, **param) -> Union[Iterator[Conversation], List[str]]:
+    def _get_conversations(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Union[Iterator[Conversation], List[str]]:
         if self.is_logged_in():
-            return CollectionGetReq[Conversation](self, req, Conversation)(**param)
+            return CollectionGetReq[Conversation](self, req, Conversation, raw=raw, fields=fields)(**param)
         return ['Not Logged in']
 
-    def _get_conversation_messages(self, req: str, **param) -> Union[Iterator[Message], List[str]]:
+    def _get_conversation_messages(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> Union[Iterator[Message], List[str]]:
         if self.is_logged_in():
-            return CollectionGetReq[Message](self, req, Message)(**param)
+            return CollectionGetReq[Message](self, req, Message, raw=raw, fields=fields)(**param)
         return ['Not Logged in']
 
     def _get_web_profile_list(self, req: str) -> List[WebProfile]:
@@ -222,11 +542,35 @@ class BaseSound:
             return DeleteReq(self, req)(**payload)
         return False
 
+    def _bulk_payload(self, method: str, links: Dict[int, str], max_workers: int = None) -> Dict[int, bool]:
+        """
+        Sends PUT/POST/DELETE To Link Of Every ID With Up To max_workers
+        At Once, Then Saves Cookies Once. Returns Success Per ID.
+        """
+        if not links:
+            return {}
+        if not self.is_logged_in():
+            return dict.fromkeys(links, False)
+        req_class = {'PUT': PutReq, 'POST': PostReq, 'DELETE': DeleteReq}[method]
+
+        def send(link: str) -> bool:
+            try:
+                return req_class(self, link)()
+            except requests.RequestException as err:
+                print(f'Something Went Wrong. {err}')
+                return False
+
+        workers = min(max_workers or self.max_workers, len(links))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(send, links.values()))
+        self._update_cookies()
+        return dict(zip(links, results))
+
     def generate_client_id(self) -> None:
         """
         Gets Client ID, App Version And User ID
         """
-        req = requests.get('https://soundcloud.com/', timeout=20)
+        req = self.session.get('https://soundcloud.com/', timeout=20)
 
         app_version = re.search(r'window\.__sc_version="\s*(\d+)"', req.text, re.DOTALL)
         user_id = re.search(r'window\.__sc_hydration\s*=\s*(\[\{.*?}]);', req.text, re.DOTALL)
@@ -252,7 +596,7 @@ class BaseSound:
         if not matches:
             return
         url = matches[-1]
-        r = requests.get(url, timeout=20)
+        r = self.session.get(url, timeout=20)
         r.raise_for_status()
         client_id = client_id.search(r.text)
         if not client_id:
@@ -261,6 +605,27 @@ class BaseSound:
         if self.is_client_id_valid():
             self.__set_conf_last()
 
+    def _refresh_client_id(self, stale: str = None) -> bool:
+        """
+        Generates New Client ID If Current One Is Still The Stale One,
+        So Threads Rejected With Same ID Regenerate It Only Once.
+        Returns True If Client ID Changed.
+        """
+        with self.client_id_lock:
+            if self.data['client_id'] != stale:
+                return True
+            if self._refreshing_client_id:
+                return False
+            self._refreshing_client_id = True
+            try:
+                self.generate_client_id()
+            finally:
+                self._refreshing_client_id = False
+            if self.data['client_id'] == stale:
+                return False
+            self.__set_conf_last()
+            return True
+
     def is_client_id_valid(self) -> bool:
         """
         Checks Is Client ID valid
@@ -281,47 +646,42 @@ class BaseSound:
         Checks Do You Logged In Your Account
         {Do You Added Your Credentials To cookies.json}
         """
-        if self.cookies:
-            if all(self.cookies.values()):
-                if os.path.exists(confDirectory):
-                    time_diff = self.__valid_time_diff()
-                    if 0 < time_diff < 60:
-                        self.__save_validate_time()
-                        return True
-                link = f'https://api-v2.soundcloud.com/users/{self.my_account_id}/conversations'
-                param = {
-                    'limit': 10,
-                    'offset': 0,
-                    'linked_partitioning': 1
-                }
-                req = requests.get(link, params=param,
-                                   cookies=self.cookies,
-                                   headers=self.headers,
-                                   timeout=20)
-                if req.status_code == 200:
-                    self.__save_validate_time()
-                    return True
+        if not self._has_credentials():
+            return False
+        if self._is_login_fresh():
+            return True
+        link, param = self._login_probe()
+        req = self._request('GET', link, params=param)
+        if req.status_code == 200:
+            self._mark_logged_in()
+            return True
         return False
 
-    def __save_validate_time(self):
-        json_dict = {
-            'user_id': self.data['user_id'],
-            'client_id': self.data['client_id'],
-            'app_version': self.data['app_version'],
-            'last_validate': datetime.now().isoformat()
+    def _has_credentials(self) -> bool:
+        return bool(self.cookies) and all(self.cookies.values())
+
+    def _is_login_fresh(self) -> bool:
+        if time.monotonic() < self._login_valid_until:
+            return True
+        if self._login_loaded or self._last_validate is None:
+            return False
+        self._login_loaded = True
+        time_diff = (datetime.now() - self._last_validate).total_seconds()
+        if 0 < time_diff < self.login_ttl:
+            self._login_valid_until = time.monotonic() + self.login_ttl - time_diff
+            return True
+        return False
+
+    def _login_probe(self) -> tuple:
+        link = f'{self.api_base or GetReq.base}/users/{self.my_account_id}/conversations'
+        param = {
+            'limit': 10,
+            'offset': 0,
+            'linked_partitioning': 1
         }
-        with open(confDirectory, 'w', encoding='utf-8') as file:
-            json.dump(json_dict, file, indent=4)
-
-    @staticmethod
-    def __valid_time_diff() -> float:
-        with open(confDirectory, 'r', encoding='utf-8') as file:
-            loaded_json = json.load(file)
-            if 'last_validate' in loaded_json.keys():
-                try:
-                    saved_time = datetime.fromisoformat(loaded_json['last_validate'])
-                except ValueError:
-                    return -1
-            else:
-                return -1
-        return (datetime.now() - saved_time).total_seconds()
+        return link, param
+
+    def _mark_logged_in(self) -> None:
+        self._last_validate = datetime.now()
+        self._login_valid_until = time.monotonic() + self.login_ttl
+        self.conf_store.update({'last_validate': self._last_validate.isoformat()})
@@ -0,0 +1,365 @@
+"""
+Async Api Handler Of SoundCld
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import wraps
+from typing import Dict, List, Optional, Sequence, Union, AsyncIterator
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # pragma: no cover
+    aiohttp = yarl = None
+
+from soundcld.api_handler import BaseSound, PlaylistState, TrackList, _chunks, _order_tracks
+from soundcld.ratelimit import RateLimiter
+from soundcld.async_request_handler import (
+    AsyncGetReq,
+    AsyncRawGetReq,
+    AsyncListGetReq,
+    AsyncCollectionGetReq,
+    AsyncPutReq,
+    AsyncDeleteReq,
+    AsyncPostReq
+)
+from soundcld.resource import (
+    SearchItem, Like, RepostItem, StreamItem,
+    Comment, BasicComment,
+    Conversation,
+    Message,
+    BasicAlbumPlaylist,
+    BasicTrack,
+    User,
+    WebProfile
+)
+
+
+def async_update_cookies_after(func):
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        result = await func(self, *args, **kwargs)
+        self._update_cookies()
+        return result
+
+    return wrapper
+
+
+@dataclass
+class AsyncBaseSound(BaseSound):
+    """
+    SoundCloud Core Class With Non-Blocking Transport.
+    Single Resources Are Awaitables, Collections Are Async Iterators.
+    Sync Methods Of BaseSound Are Overridden By Coroutines Of Same Name
+    On Purpose, So Both Clients Share One API. Inherited Blocking Helpers
+    (Client ID Generation And Validation) Run Only At Construction
+    Or In Executor, Never On Event Loop.
+    """
+    # pylint: disable=invalid-overridden-method
+    connector_limit: int = 100
+    connector_limit_per_host: int = 0
+
+    def __post_init__(self) -> None:
+        if aiohttp is None:
+            raise ImportError('AsyncSoundCloud requires aiohttp: pip install soundcld[async]')
+        self.async_session = None
+        super().__post_init__()
+
+    def _get_async_session(self) -> 'aiohttp.ClientSession':
+        if self.async_session is None or self.async_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.connector_limit_per_host,
+                force_close=not self.keep_alive
+            )
+            self.async_session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+        return self.async_session
+
+    def _async_request(self, method: str, url: str, **kwargs):
+        """
+        Sends Request Over Client's Pooled Async Session
+        With Current Cookies And Headers. Inherited Blocking Paths
+        (Client ID Generation And Validation) Keep Using _request.
+        """
+        with self.cookie_lock:
+            headers = dict(kwargs.pop('headers', self.headers) or {})
+            if 'cookies' not in kwargs:
+                kwargs['cookies'] = dict(self.cookies) if self.cookies else self.cookies
+        headers.pop('Content-Length', None)
+        kwargs.setdefault('timeout', aiohttp.ClientTimeout(total=20))
+        if self.rate_limiter is None:
+            return self._send_async(method, url, headers=headers, **kwargs)
+        return self._async_limited_request(self.rate_limiter, method, url, headers=headers, **kwargs)
+
+    def _send_async(self, method: str, url: str, **kwargs):
+        params = kwargs.pop('params', None)
+        if isinstance(params, str):
+            # Query Is Encoded Already, As On Sync Transport, So aiohttp Must Not Quote It Again
+            url = yarl.URL(f'{url}?{params}' if params else url, encoded=True)
+        elif params is not None:
+            kwargs['params'] = params
+        return self._get_async_session().request(method, url, **kwargs)
+
+    @asynccontextmanager
+    async def _async_limited_request(self, limiter: RateLimiter, method: str, url: str, **kwargs):
+        attempt = 0
+        while True:
+            await asyncio.sleep(limiter.wait(url))
+            try:
+                resp = await self._send_async(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                delay = limiter.retry_delay(method, url, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = limiter.retry_delay(
+                    method, url, attempt, resp.status, resp.headers.get('Retry-After')
+                )
+                if delay is None:
+                    break
+                resp.release()
+            await asyncio.sleep(delay)
+            attempt += 1
+        try:
+            yield resp
+        finally:
+            resp.release()
+
+    async def aclose(self) -> None:
+        """
+        Closes Pooled Connections Of Client
+        """
+        self.close()
+        if self.async_session is not None:
+            await self.async_session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _get_user(self, req: str) -> User:
+        return await AsyncGetReq[User](self, req, User)()
+
+    def _get_users(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[User]:
+        return AsyncCollectionGetReq[User](self, req, User, raw=raw, fields=fields)(**param)
+
+    async def _get_track(self, req: str) -> BasicTrack:
+        return await AsyncGetReq[BasicTrack](self, req, BasicTrack)()
+
+    async def _get_track_list(self, req: str, **param) -> List[BasicTrack]:
+        return await AsyncListGetReq[BasicTrack](self, req, BasicTrack)(**param)
+
+    def _get_tracks(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[BasicTrack]:
+        return AsyncCollectionGetReq[BasicTrack](self, req, BasicTrack, raw=raw, fields=fields)(**param)
+
+    async def _get_track_batches(
+            self,
+            req: str,
+            track_ids: List[int],
+            batch_size: int = None,
+            max_workers: int = None
+    ) -> TrackList:
+        batches = _chunks(list(dict.fromkeys(track_ids)), batch_size or self.batch_size)
+        limit = asyncio.Semaphore(max_workers or self.max_workers)
+
+        async def load(batch):
+            async with limit:
+                try:
+                    return await self._get_track_batch(req, batch)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                    print(f'Something Went Wrong. Batch Of {len(batch)} Tracks Failed: {err}')
+                    return None
+
+        found = {}
+        failed = set()
+        for batch, tracks in zip(batches, await asyncio.gather(*(load(batch) for batch in batches))):
+            if tracks is None:
+                failed.update(int(track_id) for track_id in batch)
+                continue
+            for track in tracks:
+                if track is not None:
+                    found[track.id] = track
+        return _order_tracks(track_ids, found, failed)
+
+    async def _get_album_playlist(self, req: str) -> BasicAlbumPlaylist:
+        return await AsyncGetReq[BasicAlbumPlaylist](self, req, BasicAlbumPlaylist)()
+
+    async def _get_raw(self, req: str, fresh: bool = False, **param) -> dict:
+        return await AsyncRawGetReq(self, req, fresh=fresh)(**param)
+
+    async def _get_playlist_state(self, playlist_id: int) -> Optional[PlaylistState]:
+        data = await self._get_raw(f'/playlists/{playlist_id}', fresh=True)
+        if not data or 'tracks' not in data:
+            return None
+        return PlaylistState.from_raw(data)
+
+    def _get_album_playlists(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None
+    ) -> AsyncIterator[BasicAlbumPlaylist]:
+        return AsyncCollectionGetReq[BasicAlbumPlaylist](self, req, BasicAlbumPlaylist, raw=raw, fields=fields)()
+
+    def _get_likes(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[Like]:
+        return AsyncCollectionGetReq[Like](self, req, Like, raw=raw, fields=fields)(**param)
+
+    async def _get_resolve(self, resolve_link: str):
+        return await AsyncGetReq[SearchItem](self, '/resolve', SearchItem)(url=resolve_link)
+
+    def _get_searches(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[SearchItem]:
+        param['user_id'] = self.data['user_id']
+        return AsyncCollectionGetReq[SearchItem](self, req, SearchItem, raw=raw, fields=fields)(**param)
+
+    def _get_reposts(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[RepostItem]:
+        return AsyncCollectionGetReq[RepostItem](self, req, RepostItem, raw=raw, fields=fields)(**param)
+
+    def _get_streams(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[StreamItem]:
+        return AsyncCollectionGetReq[StreamItem](self, req, StreamItem, raw=raw, fields=fields)(**param)
+
+    def _get_comments(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[Comment]:
+        return AsyncCollectionGetReq[Comment](self, req, Comment, raw=raw, fields=fields)(**param)
+
+    def _get_basic_comments(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[BasicComment]:
+        return AsyncCollectionGetReq[BasicComment](self, req, BasicComment, raw=raw, fields=fields)(**param)
+
+    async def _get_id_list(self, req: str, **param) -> List:
+        if await self.is_logged_in():
+            return await AsyncListGetReq[int](self, req, int)(**param)
+        return ['Not Logged in']
+
+    async def _get_conversations(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[Union[Conversation, str]]:
+        if await self.is_logged_in():
+            items = AsyncCollectionGetReq[Conversation](self, req, Conversation, raw=raw, fields=fields)
+            async for item in items(**param):
+                yield item
+        else:
+            yield 'Not Logged in'
+
+    async def _get_conversation_messages(
+            self,
+            req: str,
+            raw: bool = None,
+            fields: Sequence[str] = None,
+            **param
+    ) -> AsyncIterator[Union[Message, str]]:
+        if await self.is_logged_in():
+            items = AsyncCollectionGetReq[Message](self, req, Message, raw=raw, fields=fields)
+            async for item in items(**param):
+                yield item
+        else:
+            yield 'Not Logged in'
+
+    async def _get_web_profile_list(self, req: str) -> List[WebProfile]:
+        return await AsyncListGetReq[WebProfile](self, req, WebProfile)()
+
+    @async_update_cookies_after
+    async def _post_payload(self, req: str, **payload: dict) -> bool:
+        if await self.is_logged_in():
+            return await AsyncPostReq(self, req)(**payload)
+        return False
+
+    @async_update_cookies_after
+    async def _put_payload(self, req: str, **payload: dict) -> bool:
+        if await self.is_logged_in():
+            return await AsyncPutReq(self, req)(**payload)
+        return False
+
+    @async_update_cookies_after
+    async def _delete_payload(self, req: str, **payload: dict) -> bool:
+        if await self.is_logged_in():
+            return await AsyncDeleteReq(self, req)(**payload)
+        return False
+
+    async def _bulk_payload(self, method: str, links: Dict[int, str], max_workers: int = None) -> Dict[int, bool]:
+        if not links:
+            return {}
+        if not await self.is_logged_in():
+            return dict.fromkeys(links, False)
+        req_class = {'PUT': AsyncPutReq, 'POST': AsyncPostReq, 'DELETE': AsyncDeleteReq}[method]
+        limit = asyncio.Semaphore(max_workers or self.max_workers)
+
+        async def send(link: str) -> bool:
+            async with limit:
+                try:
+                    return await req_class(self, link)()
+                except aiohttp.ClientError as err:
+                    print(f'Something Went Wrong. {err}')
+                    return False
+
+        results = await asyncio.gather(*(send(link) for link in links.values()))
+        self._update_cookies()
+        return dict(zip(links, results))
+
+    async def is_logged_in(self) -> bool:
+        """
+        Checks Do You Logged In Your Account
+        {Do You Added Your Credentials To cookies.json}
+        """
+        if not self._has_credentials():
+            return False
+        if self._is_login_fresh():
+            return True
+        link, param = self._login_probe()
+        async with self._async_request('GET', link, params=param) as req:
+            if req.status == 200:
+                self._mark_logged_in()
+                return True
+        return False
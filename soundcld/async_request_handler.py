@@ -0,0 +1,302 @@
+"""
+Async Request Handler Of SoundCld
+"""
+import asyncio
+import contextlib
+import urllib.parse
+from dataclasses import dataclass
+from typing import Callable, Optional, Dict, Generic, Union, List, AsyncIterator, Sequence
+
+from soundcld import jsoncodec
+from soundcld.request_handler import (
+    T,
+    _PAGES_END,
+    _convert_dict,
+    _apply_collection_options,
+    _is_server_failure,
+    BaseReq,
+    GetReq,
+    ComplexReq
+)
+
+
+async def _async_call_params(req: BaseReq, **kwargs) -> None:
+    """
+    Like BaseReq._call_params, But Missing Client ID Is Generated
+    In Executor, So Blocking Requests Do Not Stall Event Loop
+    """
+    if not req.client.data['client_id']:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, req.client._refresh_client_id)
+    req._set_params(**kwargs)
+
+
+@dataclass
+class AsyncGetReq(GetReq, Generic[T]):
+    """
+    Core Class To Send Non-Blocking GET Request
+    To Soundcloud. Overrides GetReq Methods With
+    Coroutines, So Subclasses Mirror Sync Ones.
+    """
+    # pylint: disable=invalid-overridden-method
+
+    async def _load_href(
+            self,
+            url: str,
+            param: Dict[str, Union[str, int]],
+            retry: bool = True
+    ) -> Dict[str, Union[str, int]]:
+        cache = None if self.fresh else self.client.cache
+        if cache is not None:
+            data = cache.get(url, param)
+            if data is not None:
+                return data
+        params = urllib.parse.urlencode(param, quote_via=urllib.parse.quote)
+        async with self.client._async_request('GET', url, params=params) as req:
+            unauthorized = req.status == 401 and self.client.lazy
+            if req.status not in [200, 201] and not unauthorized:
+                print(f'Something Went Wrong. Error {req.status}')
+                if _is_server_failure(req.status):
+                    req.raise_for_status()
+                return {}
+            if not unauthorized:
+                req.raise_for_status()
+                data = jsoncodec.loads(await req.read())
+        if unauthorized:
+            loop = asyncio.get_running_loop()
+            stale = param.get('client_id')
+            if retry and await loop.run_in_executor(None, self.client._refresh_client_id, stale):
+                self._update_client_params(param)
+                return await self._load_href(url, param, retry=False)
+            print('Something Went Wrong. Error 401')
+            return {}
+        if cache is not None and data:
+            cache.set(url, param, data)
+        return data
+
+    async def __call__(self, **kwargs) -> Optional[T]:
+        await _async_call_params(self, **kwargs)
+        data = await self._load_href(self.resource_url, param=self.params)
+        return _convert_dict(data, self.return_type, self.client.identity_map)
+
+
+@dataclass
+class AsyncRawGetReq(AsyncGetReq):
+    """
+    Class To Send Non-Blocking GET Request Which
+    Returns Undecoded JSON Data.
+    """
+    return_type: type = dict
+
+    async def __call__(self, **kwargs) -> Dict:
+        await _async_call_params(self, **kwargs)
+        return await self._load_href(self.resource_url, param=self.params)
+
+
+@dataclass
+class AsyncListGetReq(AsyncGetReq, Generic[T]):
+    """
+    Class To Send Non-Blocking GET Requests Which
+    Returns List Of Return Type Data.
+    """
+
+    async def __call__(self, **kwargs) -> List[T]:
+        await _async_call_params(self, **kwargs)
+        resources = []
+        data = await self._load_href(self.resource_url, param=self.params)
+        if 'collection' not in data:
+            for resource in data:
+                resources.append(_convert_dict(resource, self.return_type, self.client.identity_map))
+        else:
+            for ids in data['collection']:
+                resources.append(ids)
+        return resources
+
+
+@dataclass
+class AsyncCollectionGetReq(AsyncGetReq, Generic[T]):
+    """
+    Class To Send Non-Blocking GET Requests Which
+    Returns Async Iterator Of Return Type Data.
+
+    With prefetch > 0 up to that many next pages are loaded
+    in background task while current page is being decoded.
+
+    With raw=True items are yielded as undecoded dicts, with fields
+    as named tuples of only those fields.
+    on_page is called with each page once all its items were yielded.
+    With start_href loading starts from that page instead of first one.
+    """
+    prefetch: Optional[int] = None
+    raw: Optional[bool] = None
+    fields: Optional[Sequence[str]] = None
+    on_page: Optional[Callable[[Dict], None]] = None
+    start_href: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._convert = _apply_collection_options(self)
+
+    async def __call__(self, **kwargs) -> AsyncIterator[T]:
+        await _async_call_params(self, **kwargs)
+        convert = self._convert
+        pages = self._pages()
+        try:
+            async for data in pages:
+                for result in data['collection']:
+                    yield result if convert is None else convert(result)
+                if self.on_page is not None:
+                    self.on_page(data)
+        finally:
+            await pages.aclose()
+
+    async def _pages(self):
+        depth = self.prefetch
+        if depth is None:
+            depth = self.client.prefetch
+        if depth > 0:
+            pages = self._prefetch_pages(depth)
+            try:
+                async for data in pages:
+                    yield data
+            finally:
+                await pages.aclose()
+            return
+        data = await self._load_href(self.start_href or self.resource_url, self.params)
+        while 'collection' in data.keys() and data['collection']:
+            yield data
+            if 'next_href' in data.keys() and data['next_href'] is not None:
+                data = await self._load_href(data['next_href'], param=self.params)
+            else:
+                break
+
+    async def _prefetch_pages(self, depth: int):
+        pages = asyncio.Queue(maxsize=depth)
+
+        async def load() -> None:
+            try:
+                data = await self._load_href(self.start_href or self.resource_url, self.params)
+                while 'collection' in data.keys() and data['collection']:
+                    await pages.put(data)
+                    if 'next_href' not in data.keys() or data['next_href'] is None:
+                        break
+                    data = await self._load_href(data['next_href'], param=self.params)
+            except Exception as err:
+                await pages.put(err)
+            await pages.put(_PAGES_END)
+
+        loader = asyncio.ensure_future(load())
+        try:
+            while True:
+                item = await pages.get()
+                if item is _PAGES_END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            loader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await loader
+
+
+@dataclass
+class AsyncComplexReq(ComplexReq):
+    """
+    Core Class To Handle Non-Blocking Complex
+    Requests Common Functionality.
+    _load_option Is Overridden With Coroutine.
+    """
+    # pylint: disable=invalid-overridden-method
+    method = ''
+
+    async def _load_option(self, client, url, payload, method: str = None) -> bool:
+        self._set_complex_headers(client, payload)
+        preflights = client.preflights
+        if preflights is not None and method and preflights.is_valid(method, url):
+            return True
+        async with client._async_request(
+                'OPTIONS',
+                url,
+                cookies=self.complex_cookies,
+                headers=self.complex_headers
+        ) as req:
+            if not f'{req.status}'.startswith('2'):
+                print(f'Something Went Wrong. Can\'t Get Options.'
+                      f'Error {req.status}')
+                return False
+            print(f'option : {req.status} : {await req.text()}')
+            req.raise_for_status()
+        if preflights is not None and method:
+            preflights.store(method, url)
+        return False
+
+    async def _load_href(
+            self,
+            url: str,
+            param: dict,
+            payload: dict
+    ) -> Dict:
+        params = urllib.parse.urlencode(
+            param,
+            quote_via=urllib.parse.quote
+        )
+        while True:
+            cached = await self._load_option(client=self.client, url=url, payload=payload, method=self.method)
+            async with self.client._async_request(
+                    self.method,
+                    url,
+                    params=params,
+                    data=self.complex_body,
+                    cookies=self.complex_cookies,
+                    headers=self._body_headers()
+            ) as req:
+                self._update_datadome(req=req, client=self.client)
+                if not cached or f'{req.status}'.startswith('2'):
+                    return await self._complex_result(req, url)
+            self.client.preflights.discard(self.method, url)
+
+    async def _complex_result(self, req, url: str) -> Dict:
+        if not f'{req.status}'.startswith('2'):
+            print(f'Something Went Wrong. Error {req.status}')
+            return {'status': 'err'}
+        print(f'{self.method.lower()} : {req.status} : {await req.text()}')
+        req.raise_for_status()
+        self._invalidate_cache(self.client, url)
+        return {'status': 'ok'}
+
+    async def __call__(self, **kwargs):
+        await _async_call_params(self, **kwargs)
+        data = await self._load_href(self.resource_url, self.params, kwargs)
+        if data['status'] == 'ok':
+            print('User Information Updated.')
+        else:
+            print('User Information Not Updated.')
+        return data['status'] == 'ok'
+
+
+@dataclass
+class AsyncPutReq(BaseReq, AsyncComplexReq):
+    """
+    Core Class To Send Non-Blocking PUT Request
+    To Soundcloud
+    """
+    method = 'PUT'
+
+
+@dataclass
+class AsyncDeleteReq(BaseReq, AsyncComplexReq):
+    """
+    Core Class To Send Non-Blocking DELETE Request
+    To Soundcloud
+    """
+    method = 'DELETE'
+
+
+@dataclass
+class AsyncPostReq(BaseReq, AsyncComplexReq):
+    """
+    Core Class To Send Non-Blocking POST Request
+    To Soundcloud
+    """
+    method = 'POST'
@@ -0,0 +1,411 @@
+"""
+Response Cache Of SoundCld
+"""
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from soundcld import jsoncodec
+
+IGNORED_PARAMS = ('client_id', 'app_version')
+
+_ID_SEGMENT = re.compile(r'(/|:)\d+(?=/|$)')
+
+DEFAULT_TTLS = {
+    '/search': 60,
+    '/search/{kind}': 60,
+    '/resolve': 3600,
+    '/tracks': 3600,
+    '/users/{id}': 3600,
+    '/users/{id}/web-profiles': 3600,
+    '/users/{id}/tracks': 300,
+    '/users/{id}/toptracks': 300,
+    '/users/{id}/albums': 300,
+    '/users/{id}/playlists_without_albums': 300,
+    '/users/{id}/likes': 300,
+    '/users/{id}/comments': 300,
+    '/users/{id}/relatedartists': 3600,
+    '/users/{id}/followers': 300,
+    '/users/{id}/followings': 300,
+    '/tracks/{id}': 3600,
+    '/tracks/{id}/likers': 300,
+    '/tracks/{id}/reposters': 300,
+    '/tracks/{id}/comments': 300,
+    '/tracks/{id}/related': 3600,
+    '/tracks/{id}/albums': 300,
+    '/tracks/{id}/playlists_without_albums': 300,
+    '/playlists/{id}': 3600,
+    '/playlists/{id}/likers': 300,
+    '/playlists/{id}/reposters': 300,
+    '/recent-tracks/{tag}': 300,
+}
+
+PRIVATE_PATHS = (
+    '/me',
+    '/me/*',
+    '/users/{id}/conversations',
+    '/users/{id}/conversations/*',
+)
+
+DEFAULT_INVALIDATIONS = {
+    '/users/{user}/track_likes/{track}': (
+        '/me/track_likes/*',
+        '/users/{user}/likes',
+        '/users/{user}/track_likes',
+        '/tracks/{track}',
+        '/tracks/{track}/likers',
+    ),
+    '/users/{user}/playlist_likes/{playlist}': (
+        '/me/playlist_likes/*',
+        '/users/{user}/likes',
+        '/users/{user}/playlist_likes',
+        '/playlists/{playlist}',
+        '/playlists/{playlist}/likers',
+    ),
+    '/me/track_reposts/{track}': (
+        '/me/track_reposts/*',
+        '/stream/users/*',
+        '/tracks/{track}',
+        '/tracks/{track}/reposters',
+    ),
+    '/me/playlist_reposts/{playlist}': (
+        '/me/playlist_reposts/*',
+        '/stream/users/*',
+        '/playlists/{playlist}',
+        '/playlists/{playlist}/reposters',
+    ),
+    '/playlists': (
+        '/users/{id}/playlists_without_albums',
+        '/users/{id}/albums',
+    ),
+    '/playlists/{playlist}': (
+        '/users/{id}/playlists_without_albums',
+        '/users/{id}/albums',
+        '/tracks/{id}/playlists_without_albums',
+        '/tracks/{id}/albums',
+    ),
+    '/me': (
+        '/users/{id}',
+        '/resolve',
+    ),
+}
+
+
+def _compile_pattern(pattern: str, values: Dict[str, str] = None):
+    regex = ''
+    for part in re.split(r'(\{[^}]*}|\*)', pattern):
+        if part == '*':
+            regex += '.*'
+        elif part.startswith('{') and part.endswith('}'):
+            name = part[1:-1]
+            if values and name in values:
+                regex += re.escape(values[name])
+            elif values is None:
+                regex += f'(?P<{name}>[^/]+)'
+            else:
+                regex += '[^/]+'
+        else:
+            regex += re.escape(part)
+    return re.compile(f'{regex}$')
+
+
+class ResponseCache:
+    """
+    Base Class Of GET Response Caches.
+    Keys Are URL With Sorted Params, Without client_id And app_version.
+    TTLs Are Set Per Path Pattern Like '/users/{id}' Or '/search/*',
+    First Matching Pattern Wins, Others Use default_ttl.
+    TTL Of 0 Disables Caching Of That Path, Which Is Default For
+    Paths Not Listed. Keys Do Not Include Auth, So PRIVATE_PATHS
+    (/me And Conversations) Are Never Cached.
+    invalidations Maps Mutated Path Patterns To GET Path Patterns
+    Whose Entries It Makes Stale, Placeholders Of Same Name Are
+    Filled With Values From Mutated Path.
+    """
+
+    def __init__(
+            self,
+            ttls: Dict[str, float] = None,
+            default_ttl: float = 0,
+            invalidations: Dict[str, Sequence[str]] = None
+    ):
+        if ttls is None:
+            ttls = DEFAULT_TTLS
+        if invalidations is None:
+            invalidations = DEFAULT_INVALIDATIONS
+        self.ttls = [(_compile_pattern(pattern), ttl) for pattern, ttl in ttls.items()]
+        self.private = [_compile_pattern(pattern) for pattern in PRIVATE_PATHS]
+        self.invalidations = [
+            (_compile_pattern(pattern), tuple(affected)) for pattern, affected in invalidations.items()
+        ]
+        self.default_ttl = default_ttl
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any] = None) -> Tuple[str, str]:
+        """
+        Returns Normalized Cache Key And Path Of Request
+        """
+        parts = urllib.parse.urlsplit(url)
+        query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if params:
+            query.extend((key, str(value)) for key, value in params.items())
+        query = sorted(item for item in query if item[0] not in IGNORED_PARAMS)
+        key = f'{parts.netloc}{parts.path}?{urllib.parse.urlencode(query)}'
+        return key, parts.path
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Returns TTL Of Given Path
+        """
+        if any(pattern.match(path) for pattern in self.private):
+            return 0
+        for pattern, ttl in self.ttls:
+            if pattern.match(path):
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str, params: Dict[str, Any] = None) -> Optional[Any]:
+        """
+        Returns Copy Of Cached Response Or None.
+        Paths Which Are Not Cached Are Not Looked Up Or Counted.
+        """
+        key, path = self.make_key(url, params)
+        if self.ttl_for(path) <= 0:
+            return None
+        value = self._get(key, time.time())
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, url: str, params: Dict[str, Any], value: Any) -> None:
+        """
+        Stores Response If Its Path Is Cacheable
+        """
+        key, path = self.make_key(url, params)
+        ttl = self.ttl_for(path)
+        if ttl > 0:
+            self._set(key, path, time.time() + ttl, value)
+
+    def invalidate(self, url: str) -> None:
+        """
+        Removes Entries Of Resource At Given URL, Its Sub-Resources,
+        Its Parent Paths (Which Hold Counts And Collections Of It)
+        And Paths Listed In invalidations For It.
+        """
+        path = urllib.parse.urlsplit(url).path.rstrip('/')
+        prefix = path + '/'
+        parents = set()
+        parent = path
+        while '/' in parent.strip('/'):
+            parent = parent.rsplit('/', 1)[0]
+            parents.add(parent)
+        affected = []
+        for pattern, patterns in self.invalidations:
+            match = pattern.match(path)
+            if match is not None:
+                values = match.groupdict()
+                affected.extend(_compile_pattern(item, values) for item in patterns)
+
+        def is_stale(entry_path: str) -> bool:
+            if entry_path == path or entry_path.startswith(prefix) or entry_path in parents:
+                return True
+            return any(item.match(entry_path) for item in affected)
+
+        self._delete(is_stale)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns Hit/Miss Statistics
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def clear(self) -> None:
+        """
+        Removes All Entries
+        """
+        raise NotImplementedError
+
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        raise NotImplementedError
+
+    def _set(self, key: str, path: str, expires: float, value: Any) -> None:
+        raise NotImplementedError
+
+    def _delete(self, is_stale: Callable[[str], bool]) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-Memory LRU Response Cache, Responses Are Kept Serialized
+    So Callers Changing Returned Data Do Not Change Cache
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            ttls: Dict[str, float] = None,
+            default_ttl: float = 0,
+            invalidations: Dict[str, Sequence[str]] = None
+    ):
+        super().__init__(ttls=ttls, default_ttl=default_ttl, invalidations=invalidations)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return jsoncodec.loads(entry[2])
+
+    def _set(self, key: str, path: str, expires: float, value: Any) -> None:
+        data = jsoncodec.dumps(value)
+        with self._lock:
+            self._entries[key] = (path, expires, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _delete(self, is_stale: Callable[[str], bool]) -> None:
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if is_stale(entry[0]):
+                    del self._entries[key]
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-Disk Response Cache Stored In SQLite Database
+    """
+
+    def __init__(
+            self,
+            path: str,
+            ttls: Dict[str, float] = None,
+            default_ttl: float = 0,
+            invalidations: Dict[str, Sequence[str]] = None
+    ):
+        super().__init__(ttls=ttls, default_ttl=default_ttl, invalidations=invalidations)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(key TEXT PRIMARY KEY, path TEXT, expires REAL, value TEXT)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS responses_path ON responses (path)')
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """
+        Closes Database Connection
+        """
+        with self._lock:
+            self._conn.close()
+
+    def _get(self, key: str, now: float) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT expires, value FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] < now:
+                with self._conn:
+                    self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+        return jsoncodec.loads(row[1])
+
+    def _set(self, key: str, path: str, expires: float, value: Any) -> None:
+        data = jsoncodec.dumps(value)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, path, expires, value) VALUES (?, ?, ?, ?)',
+                (key, path, expires, data)
+            )
+
+    def _delete(self, is_stale: Callable[[str], bool]) -> None:
+        with self._lock, self._conn:
+            paths = [row[0] for row in self._conn.execute('SELECT DISTINCT path FROM responses')]
+            self._conn.executemany(
+                'DELETE FROM responses WHERE path = ?',
+                [(path,) for path in paths if is_stale(path)]
+            )
+
+
+class PreflightCache:
+    """
+    Remembers Successful OPTIONS Preflights Per Method And
+    URL Template (IDs Replaced With '{id}') For ttl Seconds.
+    """
+
+    def __init__(self, ttl: float = 300):
+        self.ttl = ttl
+        self.hits = self.misses = 0
+        self._entries: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def template(url: str) -> str:
+        """
+        Returns URL Template Of Given URL
+        """
+        path = urllib.parse.urlsplit(url).path
+        return _ID_SEGMENT.sub(r'\1{id}', path)
+
+    def is_valid(self, method: str, url: str) -> bool:
+        """
+        Returns True If Preflight Of Method And URL Is Cached
+        """
+        key = (method, self.template(url))
+        with self._lock:
+            expires = self._entries.get(key)
+            valid = expires is not None and expires > time.time()
+            if valid:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._entries.pop(key, None)
+            return valid
+
+    def store(self, method: str, url: str) -> None:
+        """
+        Stores Successful Preflight
+        """
+        if self.ttl > 0:
+            with self._lock:
+                self._entries[(method, self.template(url))] = time.time() + self.ttl
+
+    def discard(self, method: str, url: str) -> None:
+        """
+        Forgets Preflight, So Next Request Sends OPTIONS Again
+        """
+        with self._lock:
+            self._entries.pop((method, self.template(url)), None)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns Hit/Miss Statistics
+        """
+        return {'hits': self.hits, 'misses': self.misses}
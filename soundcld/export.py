@@ -0,0 +1,108 @@
+"""
+JSONL Exporter Of SoundCld Collections
+"""
+import gzip
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from soundcld import jsoncodec
+from soundcld.request_handler import collection_options
+from soundcld.state import write_json_atomic
+
+
+@dataclass
+class ExportResult:
+    """
+    Progress Of Export, Also Saved In '<path>.state'
+    """
+    path: str
+    count: int = 0
+    pages: int = 0
+    next_href: Optional[str] = None
+    offset: int = 0
+    done: bool = False
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Returns Progress As Dict Saved In State File
+        """
+        return {
+            'count': self.count,
+            'pages': self.pages,
+            'next_href': self.next_href,
+            'offset': self.offset,
+            'done': self.done
+        }
+
+
+def export_jsonl(
+        method: Callable[..., Iterator],
+        path: str,
+        *args,
+        compress: bool = None,
+        decode: bool = False,
+        resume: bool = True,
+        **kwargs
+) -> ExportResult:
+    """
+    Streams Every Item Of Collection Method (get_user_followers,
+    get_user_likes, get_track_comments, ...) Called With Given
+    Arguments To JSONL File, One Page At A Time.
+    Items Are Written As Received Unless decode Is True, In Which
+    Case They Are Decoded Into Models And Written With to_dict().
+    With compress (Default: Path Ends With '.gz') Each Page Is Written
+    As Its Own gzip Member. After Each Page Its next_href And File
+    Offset Are Saved To '<path>.state', So Interrupted Export Is
+    Resumed From Last Complete Page When resume Is True.
+    """
+    if compress is None:
+        compress = path.endswith('.gz')
+    state_path = f'{path}.state'
+    result = ExportResult(path=path)
+    if resume and os.path.exists(state_path) and os.path.exists(path):
+        with open(state_path, 'rb') as file:
+            result = ExportResult(path=path, **jsoncodec.loads(file.read()))
+        if result.done:
+            return result
+    elif os.path.exists(state_path):
+        os.remove(state_path)
+    start_href = result.next_href
+    if result.pages and start_href is None:
+        result.done = True
+        return result
+    lines = []
+
+    def save_page(data: dict) -> None:
+        _write_page(file, lines, compress)
+        result.count += len(lines)
+        result.pages += 1
+        result.next_href = data.get('next_href')
+        result.offset = file.tell()
+        lines.clear()
+        write_json_atomic(state_path, result.to_state())
+
+    with open(path, 'r+b' if result.pages else 'wb') as file:
+        file.truncate(result.offset)
+        file.seek(result.offset)
+        with collection_options(raw=not decode, on_page=save_page, start_href=start_href):
+            items = method(*args, **kwargs)
+        for item in items:
+            if item is not None:
+                lines.append(jsoncodec.dumps(item.to_dict() if decode else item))
+        if lines:
+            save_page({})
+    result.done = True
+    write_json_atomic(state_path, result.to_state())
+    return result
+
+
+def _write_page(file, lines: list, compress: bool) -> None:
+    data = b'\n'.join(lines) + b'\n' if lines else b''
+    if compress:
+        with gzip.GzipFile(fileobj=file, mode='wb', mtime=0) as member:
+            member.write(data)
+    else:
+        file.write(data)
+    file.flush()
+    os.fsync(file.fileno())
@@ -0,0 +1,99 @@
+"""
+JSON Codec Of SoundCld
+"""
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec:
+    """
+    Base JSON Codec. loads Takes Bytes Or Str,
+    dumps Returns Compact UTF-8 Bytes.
+    """
+    name = ''
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Parses JSON Document
+        """
+        raise NotImplementedError
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serializes Value To Compact JSON Bytes
+        """
+        raise NotImplementedError
+
+
+class StdlibCodec(JsonCodec):
+    """
+    Codec Using Standard json Module
+    """
+    name = 'json'
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec Using orjson (pip install .[fast])
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('orjson is not installed')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+
+_codec: Optional[JsonCodec] = None
+
+
+def get_codec() -> JsonCodec:
+    """
+    Returns Codec In Use, orjson If It Is Installed, Otherwise json
+    """
+    global _codec
+    if _codec is None:
+        _codec = OrjsonCodec() if orjson is not None else StdlibCodec()
+    return _codec
+
+
+def set_codec(codec: Union[JsonCodec, str, None]) -> JsonCodec:
+    """
+    Sets Codec Used By All Clients. Takes Codec, Its Name ('json',
+    'orjson'), Or None To Go Back To Default. Returns Codec In Use.
+    """
+    global _codec
+    if isinstance(codec, str):
+        codec = {'json': StdlibCodec, 'orjson': OrjsonCodec}[codec]()
+    _codec = codec
+    return get_codec()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses JSON Document With Codec In Use
+    """
+    return get_codec().loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializes Value To Compact JSON Bytes With Codec In Use
+    """
+    return get_codec().dumps(value)
@@ -0,0 +1,187 @@
+"""
+Rate Limiter Of SoundCld
+"""
+import email.utils
+import random
+import threading
+import time
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+DEFAULT_RATES = {
+    'search': (5, 10),
+}
+
+
+class TokenBucket:
+    """
+    Token Bucket Refilled With rate Tokens Per Second Up To burst.
+    Rate Is Halved On Throttling And Recovers Step By Step On Success.
+    """
+
+    def __init__(self, rate: float, burst: float, min_rate: float = 0.5):
+        self.base_rate = self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.tokens = burst
+        self.paused_until = 0.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes One Token, Returns Seconds To Wait Before Using It
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = max(0.0, -self.tokens / self.rate)
+            return max(wait, self.paused_until - now)
+
+    def throttled(self, pause: float = 0.0) -> None:
+        """
+        Halves Rate And Pauses Bucket For Given Seconds
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+
+    def succeeded(self) -> None:
+        """
+        Moves Rate Back Towards Base Rate
+        """
+        with self._lock:
+            if self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate + self.base_rate / 20)
+
+
+class RateLimiter:
+    """
+    Client-Wide Rate Limiter With One Bucket Per Endpoint Family
+    (First Path Segment Like 'search', 'users', 'me').
+    Failed Requests (429, 5xx, Connection Errors) Are Retried With
+    Jittered Exponential Backoff Or After Retry-After, While Retry Budget
+    (retry_ratio Retries Per Request, Up To max_budget Saved) Lasts.
+    """
+
+    def __init__(
+            self,
+            rate: float = 10,
+            burst: float = 20,
+            rates: Dict[str, Tuple[float, float]] = None,
+            retries: int = 4,
+            backoff: float = 0.5,
+            max_backoff: float = 30,
+            retry_ratio: float = 0.2,
+            max_budget: float = 10
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.rates = DEFAULT_RATES if rates is None else rates
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_ratio = retry_ratio
+        self.max_budget = max_budget
+        self.budget = max_budget
+        self.requests = self.retried = self.throttled = self.exhausted = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def family(url: str) -> str:
+        """
+        Returns Endpoint Family Of URL
+        """
+        path = urllib.parse.urlsplit(url).path.strip('/')
+        return path.split('/', 1)[0]
+
+    def bucket(self, url: str) -> TokenBucket:
+        """
+        Returns Bucket Of URL's Endpoint Family
+        """
+        family = self.family(url)
+        with self._lock:
+            bucket = self._buckets.get(family)
+            if bucket is None:
+                rate, burst = self.rates.get(family, (self.rate, self.burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[family] = bucket
+            return bucket
+
+    def wait(self, url: str) -> float:
+        """
+        Reserves Slot For Request, Returns Seconds To Wait Before Sending
+        """
+        with self._lock:
+            self.requests += 1
+            self.budget = min(self.max_budget, self.budget + self.retry_ratio)
+        return self.bucket(url).reserve()
+
+    def retry_delay(
+            self,
+            method: str,
+            url: str,
+            attempt: int,
+            status: int = None,
+            retry_after: str = None
+    ) -> Optional[float]:
+        """
+        Records Result Of Attempt. Returns Seconds To Wait Before
+        Retrying, Or None If Request Must Not Be Retried.
+        Status None Means Connection Error.
+        """
+        bucket = self.bucket(url)
+        if status is not None and status != 429 and status < 500:
+            bucket.succeeded()
+            return None
+        if status != 429 and method.upper() not in IDEMPOTENT_METHODS:
+            return None
+        pause = _parse_retry_after(retry_after)
+        if status == 429:
+            bucket.throttled(pause or 0.0)
+            with self._lock:
+                self.throttled += 1
+        if attempt >= self.retries:
+            return None
+        with self._lock:
+            if self.budget < 1:
+                self.exhausted += 1
+                return None
+            self.budget -= 1
+            self.retried += 1
+        if pause is not None:
+            return min(pause, self.max_backoff)
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(delay / 2, delay)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns Request, Retry And Throttling Counters
+        """
+        return {
+            'requests': self.requests,
+            'retried': self.retried,
+            'throttled': self.throttled,
+            'exhausted': self.exhausted,
+            'budget': self.budget,
+            'rates': {family: bucket.rate for family, bucket in self._buckets.items()}
+        }
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
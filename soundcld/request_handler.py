@@ -1,55 +1,129 @@
 """
 Request Handler Of SoundCld
 """
-import json
+import queue
+import threading
 import urllib.parse
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional, Dict, Generic, TypeVar, get_origin, Union, List
+from functools import lru_cache
+from typing import Any, Callable, Optional, Dict, Generic, Sequence, Tuple, TypeVar, get_origin, Union, List
 
 import requests
-from dacite import MissingValueError
-
-from soundcld.resource import (
-    PlaylistLike, TrackLike,
-    AlbumPlaylist, BasicAlbumPlaylist,
-    PlaylistStreamItem, PlaylistStreamRepostItem,
-    TrackStreamItem, TrackStreamRepostItem,
-    Track, BasicTrack,
-    User, BasicUser
-)
+
+from soundcld import jsoncodec
+from soundcld.resource.decoder import compile_union
+from soundcld.resource.identity import IdentityMap, current_identity_map
+from soundcld.resource.lazy import lazy_type
+from soundcld.resource.slotted import slotted_type
 
 T = TypeVar('T')
 
+_PAGES_END = object()
+_UNAUTHORIZED = object()
+
+
+@dataclass(frozen=True)
+class CollectionOptions:
+    """
+    Options Of Collections Created Inside collection_options
+    """
+    raw: bool = False
+    fields: Optional[Tuple[str, ...]] = None
+    on_page: Optional[Callable[[Dict], None]] = None
+    start_href: Optional[str] = None
 
-def _convert_dict(data, return_type: T):
-    union = get_origin(return_type) is Union
-    data_type = ''
-    union_types = {
-        'user': [User, BasicUser],
-        'track': [Track, BasicTrack, TrackStreamItem],
-        'playlist': [AlbumPlaylist, BasicAlbumPlaylist, PlaylistStreamItem],
-        'like': [TrackLike, PlaylistLike],
-        'playlist-repost': [PlaylistStreamRepostItem],
-        'track-repost': [TrackStreamRepostItem]
-    }
+
+current_collection_options: ContextVar[Optional[CollectionOptions]] = ContextVar(
+    'current_collection_options', default=None
+)
+
+
+def _convert_dict(data, return_type: T, identity_map: IdentityMap = None):
+    token = current_identity_map.set(identity_map)
     try:
-        if union:
-            if 'kind' in data.keys():
-                data_type = data['kind']
-            if 'type' in data.keys():
-                data_type = data['type']
-            if data_type in union_types:
-                for t in union_types[data_type]:
-                    try:
-                        return t.from_dict(data)
-                    except MissingValueError:
-                        pass
-        else:
-            return return_type.from_dict(data)
-        raise ValueError(f"Could not convert {data} to type {return_type}")
+        if get_origin(return_type) is Union:
+            return compile_union(return_type)(data)
+        return return_type.from_dict(data)
     except Exception as err:
         print(err)
         return None
+    finally:
+        current_identity_map.reset(token)
+
+
+def _field_names(fields: Union[str, Sequence[str], None]) -> Optional[Tuple[str, ...]]:
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.replace(',', ' ').split()
+    return tuple(fields)
+
+
+@lru_cache(maxsize=None)
+def _projection(fields: Tuple[str, ...]) -> Callable[[Dict], tuple]:
+    row = namedtuple('Projection', fields)
+    make = row._make
+
+    def project(data: Dict) -> tuple:
+        return make(map(data.get, fields))
+
+    return project
+
+
+def _apply_collection_options(req) -> Optional[Callable[[Dict], Any]]:
+    """
+    Fills Options Of Collection Request Not Given From collection_options.
+    Returns Converter Of Collection Items, Or None For Raw Dicts.
+    """
+    options = current_collection_options.get()
+    if options is not None:
+        if req.raw is None:
+            req.raw = options.raw
+        if req.fields is None:
+            req.fields = options.fields
+        if req.on_page is None:
+            req.on_page = options.on_page
+        if req.start_href is None:
+            req.start_href = options.start_href
+    fields = _field_names(req.fields)
+    if fields:
+        return _projection(fields)
+    if req.raw:
+        return None
+    return_type, identity_map = req.return_type, req.client.identity_map
+    return lambda data: _convert_dict(data, return_type, identity_map)
+
+
+def _is_server_failure(status: int) -> bool:
+    """
+    Returns True For Statuses Which Are Retried (429, 5xx),
+    Those Are Raised Once Retries Run Out Instead Of Read As No Data
+    """
+    return status == 429 or status >= 500
+
+
+@contextmanager
+def collection_options(
+        raw: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        on_page: Callable[[Dict], None] = None,
+        start_href: str = None
+):
+    """
+    Collections Created Inside Yield Undecoded Dicts (raw=True)
+    Or Named Tuples Of Only Given Fields Instead Of Models.
+    on_page Is Called With Each Page After All Its Items Were Yielded,
+    start_href Makes Collection Start From Given Page (Its next_href).
+    Applies To Current Thread Or Asyncio Task Only.
+    """
+    token = current_collection_options.set(CollectionOptions(raw, _field_names(fields), on_page, start_href))
+    try:
+        yield
+    finally:
+        current_collection_options.reset(token)
 
 
 @dataclass
@@ -63,7 +137,12 @@ class BaseReq(Generic[T]):
     format_url: str
 
     def _call_params(self, **kwargs) -> None:
-        self.resource_url = self.base + self.format_url
+        if not self.client.data['client_id']:
+            self.client._refresh_client_id()
+        self._set_params(**kwargs)
+
+    def _set_params(self, **kwargs) -> None:
+        self.resource_url = (self.client.api_base or self.base) + self.format_url
         self.params = kwargs
         self.params.update({
             'client_id': self.client.data['client_id'],
@@ -76,25 +155,99 @@ class BaseReq(Generic[T]):
 class GetReq(BaseReq, Generic[T]):
     """
     Core Class To Send GET Request
-    To Soundcloud
+    To Soundcloud.
+    With fresh=True Response Cache And Request Coalescing Are Skipped,
+    So Response Always Comes From Server.
     """
     return_type: T
+    fresh: bool = False
 
-    def _load_href(self, url: str, param: Dict[str, Union[str, int]]) -> Dict[str, Union[str, int]]:
+    def __post_init__(self) -> None:
+        if self.client.slotted:
+            self.return_type = slotted_type(self.return_type)
+        elif self.client.lazy_models:
+            self.return_type = lazy_type(self.return_type)
+
+    def _load_href(
+            self,
+            url: str,
+            param: Dict[str, Union[str, int]],
+            retry: bool = True
+    ) -> Dict[str, Union[str, int]]:
+        cache = None if self.fresh else self.client.cache
+        if cache is not None:
+            data = cache.get(url, param)
+            if data is not None:
+                return data
         params = urllib.parse.urlencode(param, quote_via=urllib.parse.quote)
-        with requests.get(url=url, params=params, timeout=20,
-                          cookies=self.client.cookies,
-                          headers=self.client.headers) as req:
+        inflight = None if self.fresh else self.client.inflight
+        if inflight is None:
+            data = self._fetch(url, params)
+        else:
+            data = inflight.do(('GET', url, params), lambda: self._fetch(url, params))
+        if data is _UNAUTHORIZED:
+            if retry and self.client._refresh_client_id(param.get('client_id')):
+                self._update_client_params(param)
+                return self._load_href(url, param, retry=False)
+            print('Something Went Wrong. Error 401')
+            return {}
+        if cache is not None and data:
+            cache.set(url, param, data)
+        return data
+
+    def _update_client_params(self, param: Dict[str, Union[str, int]]) -> None:
+        param['client_id'] = self.client.data['client_id']
+        param['app_version'] = self.client.data['app_version']
+
+    def _fetch(self, url: str, params: str) -> Dict[str, Union[str, int]]:
+        with self.client._request('GET', url, params=params) as req:
+            if req.status_code == 401 and self.client.lazy:
+                return _UNAUTHORIZED
             if req.status_code not in [200, 201]:
                 print(f'Something Went Wrong. Error {req.status_code}')
+                if _is_server_failure(req.status_code):
+                    req.raise_for_status()
                 return {}
             req.raise_for_status()
-            return req.json()
+            return jsoncodec.loads(req.content)
 
     def __call__(self, **kwargs) -> Optional[T]:
         self._call_params(**kwargs)
+        inflight = None if self.fresh else self.client.inflight
+        if inflight is None:
+            return self._load_resource()
+        key = (self.return_type, self.resource_url, tuple(sorted(self.params.items())))
+        return inflight.do(key, self._load_resource)
+
+    def cached(self, **kwargs) -> Optional[T]:
+        """
+        Returns Resource From Client's Response Cache,
+        Or None If It Is Not Cached. Never Calls Network.
+        """
+        cache = self.client.cache
+        if cache is None:
+            return None
+        self._call_params(**kwargs)
+        data = cache.get(self.resource_url, self.params)
+        if data is None:
+            return None
+        return _convert_dict(data, self.return_type, self.client.identity_map)
+
+    def _load_resource(self) -> Optional[T]:
         data = self._load_href(self.resource_url, param=self.params)
-        return _convert_dict(data, self.return_type)
+        return _convert_dict(data, self.return_type, self.client.identity_map)
+
+
+@dataclass
+class RawGetReq(GetReq):
+    """
+    Class To Send GET Request Which
+    Returns Undecoded JSON Data.
+    """
+    return_type: type = dict
+
+    def _load_resource(self) -> Dict:
+        return self._load_href(self.resource_url, param=self.params)
 
 
 @dataclass
@@ -110,7 +263,7 @@ class ListGetReq(GetReq, Generic[T]):
         data = self._load_href(self.resource_url, param=self.params)
         if 'collection' not in data:
             for resource in data:
-                resources.append(_convert_dict(resource, self.return_type))
+                resources.append(_convert_dict(resource, self.return_type, self.client.identity_map))
         else:
             for ids in data['collection']:
                 resources.append(ids)
@@ -122,19 +275,89 @@ class CollectionGetReq(GetReq, Generic[T]):
     """
     Class To Send GET Requests Which
     Returns Collection Of Return Type Data.
+
+    With prefetch > 0 up to that many next pages are loaded
+    in background while current page is being decoded.
+
+    With raw=True items are yielded as undecoded dicts, with fields
+    as named tuples of only those fields; neither touches dacite.
+    on_page is called with each page once all its items were yielded.
+    With start_href loading starts from that page instead of first one.
     """
+    prefetch: Optional[int] = None
+    raw: Optional[bool] = None
+    fields: Optional[Sequence[str]] = None
+    on_page: Optional[Callable[[Dict], None]] = None
+    start_href: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._convert = _apply_collection_options(self)
 
     def __call__(self, **kwargs):
         self._call_params(**kwargs)
-        data = self._load_href(self.resource_url, self.params)
+        convert = self._convert
+        for data in self._pages():
+            if convert is None:
+                yield from data['collection']
+            else:
+                yield from map(convert, data['collection'])
+            if self.on_page is not None:
+                self.on_page(data)
+
+    def _pages(self):
+        depth = self.prefetch
+        if depth is None:
+            depth = self.client.prefetch
+        if depth > 0:
+            yield from self._prefetch_pages(depth)
+            return
+        data = self._load_href(self.start_href or self.resource_url, self.params)
         while 'collection' in data.keys() and data['collection']:
-            for result in data['collection']:
-                yield _convert_dict(result, self.return_type)
+            yield data
             if 'next_href' in data.keys() and data['next_href'] is not None:
                 data = self._load_href(data['next_href'], param=self.params)
             else:
                 break
 
+    def _prefetch_pages(self, depth: int):
+        pages = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def load() -> None:
+            try:
+                data = self._load_href(self.start_href or self.resource_url, self.params)
+                while not stop.is_set() and 'collection' in data.keys() and data['collection']:
+                    put(data)
+                    if 'next_href' not in data.keys() or data['next_href'] is None:
+                        break
+                    data = self._load_href(data['next_href'], param=self.params)
+            except Exception as err:
+                put(err)
+            finally:
+                put(_PAGES_END)
+
+        loader = threading.Thread(target=load, daemon=True)
+        loader.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is _PAGES_END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
 
 @dataclass
 class ComplexReq:
@@ -143,29 +366,70 @@ class ComplexReq:
     Requests Common Functionality.
     """
 
-    def _load_option(self, client, url, payload):
-        self.complex_cookies = client.cookies
-        self.complex_headers = client.headers
-        self.complex_headers['Content-Length'] = '0'
-        self.complex_headers['x-datadome-clientid'] = client.cookies['datadome']
-        if payload:
-            my_payload = json.dumps(payload)
-            my_payload = my_payload.replace(': "', ':"')
-            my_payload = my_payload.replace(', ', ',')
-            self.complex_headers['Content-Length'] = f'{len(my_payload)}'
-        with requests.options(
-                url=url,
-                timeout=20,
+    def _load_option(self, client, url, payload, method: str = None) -> bool:
+        """
+        Sends OPTIONS Preflight, Unless Valid One Is Cached.
+        Returns True When Cached Preflight Was Used.
+        """
+        self._set_complex_headers(client, payload)
+        preflights = client.preflights
+        if preflights is not None and method and preflights.is_valid(method, url):
+            return True
+        with client._request(
+                'OPTIONS',
+                url,
                 cookies=self.complex_cookies,
                 headers=self.complex_headers
         ) as req:
             if not f'{req.status_code}'.startswith('2'):
                 print(f'Something Went Wrong. Can\'t Get Options.'
                       f'Error {req.status_code}')
-                return {'status': 'err'}
+                return False
             else:
                 print(f'option : {req.status_code} : {req.text}')
             req.raise_for_status()
+        if preflights is not None and method:
+            preflights.store(method, url)
+        return False
+
+    def _send_complex(self, method: str, url: str, params: str, payload: dict) -> requests.Response:
+        """
+        Sends Request After Its Preflight. If Request Is Rejected
+        While Cached Preflight Was Used, Preflight Is Done Again.
+        """
+        while True:
+            cached = self._load_option(client=self.client, url=url, payload=payload, method=method)
+            req = self.client._request(
+                method,
+                url,
+                params=params,
+                data=self.complex_body,
+                cookies=self.complex_cookies,
+                headers=self._body_headers()
+            )
+            self._update_datadome(req=req, client=self.client)
+            if not cached or f'{req.status_code}'.startswith('2'):
+                return req
+            self.client.preflights.discard(method, url)
+
+    def _set_complex_headers(self, client, payload):
+        with client.cookie_lock:
+            self.complex_cookies = dict(client.cookies)
+            self.complex_headers = dict(client.headers)
+        self.complex_body = jsoncodec.dumps(payload or {})
+        self.complex_headers['Content-Length'] = f'{len(self.complex_body)}' if payload else '0'
+        self.complex_headers['x-datadome-clientid'] = self.complex_cookies['datadome']
+
+    def _body_headers(self) -> Dict[str, str]:
+        headers = dict(self.complex_headers)
+        headers['Content-Length'] = f'{len(self.complex_body)}'
+        headers['Content-Type'] = 'application/json'
+        return headers
+
+    @staticmethod
+    def _invalidate_cache(client, url: str) -> None:
+        if client.cache is not None:
+            client.cache.invalidate(url)
 
     @staticmethod
     def _update_datadome(req: requests.Response, client):
@@ -175,7 +439,8 @@ class ComplexReq:
             for item in x_set_cookie:
                 if 'datadome' in item:
                     x_set_datadome_cookie = item.split('=')[1]
-                    client.cookies['datadome'] = x_set_datadome_cookie
+                    with client.cookie_lock:
+                        client.cookies['datadome'] = x_set_datadome_cookie
                     break
 
 
@@ -196,21 +461,13 @@ class PutReq(BaseReq, ComplexReq):
             param,
             quote_via=urllib.parse.quote
         )
-        self._load_option(client=self.client, url=url, payload=payload)
-        req = requests.put(
-            url=url,
-            params=params,
-            json=payload,
-            timeout=20,
-            cookies=self.complex_cookies,
-            headers=self.complex_headers
-        )
-        self._update_datadome(req=req, client=self.client)
+        req = self._send_complex('PUT', url, params, payload)
         if not f'{req.status_code}'.startswith('2'):
             print(f'Something Went Wrong. Error {req.status_code}')
             return {'status': 'err'}
         print(f'putting : {req.status_code} : {req.text}')
         req.raise_for_status()
+        self._invalidate_cache(self.client, url)
         return {'status': 'ok'}
 
     def __call__(self, **kwargs):
@@ -220,6 +477,7 @@ class PutReq(BaseReq, ComplexReq):
             print('User Information Updated.')
         else:
             print('User Information Not Updated.')
+        return data['status'] == 'ok'
 
 
 @dataclass
@@ -239,21 +497,13 @@ class DeleteReq(BaseReq, ComplexReq):
             param,
             quote_via=urllib.parse.quote
         )
-        self._load_option(client=self.client, url=url, payload=payload)
-        req = requests.delete(
-            url=url,
-            params=params,
-            json=payload,
-            timeout=20,
-            cookies=self.complex_cookies,
-            headers=self.complex_headers
-        )
-        self._update_datadome(req=req, client=self.client)
+        req = self._send_complex('DELETE', url, params, payload)
         if not f'{req.status_code}'.startswith('2'):
             print(f'Something Went Wrong. Error {req.status_code}')
             return {'status': 'err'}
         print(f'deleting : {req.status_code} : {req.text}')
         req.raise_for_status()
+        self._invalidate_cache(self.client, url)
         return {'status': 'ok'}
 
     def __call__(self, **kwargs):
@@ -263,6 +513,7 @@ class DeleteReq(BaseReq, ComplexReq):
             print('User Information Updated.')
         else:
             print('User Information Not Updated.')
+        return data['status'] == 'ok'
 
 
 @dataclass
@@ -282,28 +533,20 @@ class PostReq(BaseReq, ComplexReq):
             param,
             quote_via=urllib.parse.quote
         )
-        self._load_option(client=self.client, url=url, payload=payload)
-        req = requests.post(
-            url=url,
-            params=params,
-            json=payload,
-            timeout=20,
-            cookies=self.complex_cookies,
-            headers=self.complex_headers
-        )
-        self._update_datadome(req=req, client=self.client)
+        req = self._send_complex('POST', url, params, payload)
         if not f'{req.status_code}'.startswith('2'):
             print(f'Something Went Wrong. Error {req.status_code}')
             return {'status': 'err'}
         print(f'posting : {req.status_code} : {req.text}')
         req.raise_for_status()
+        self._invalidate_cache(self.client, url)
         return {'status': 'ok'}
 
     def __call__(self, **kwargs):
         self._call_params(**kwargs)
         data = self._load_href(self.resource_url, self.params, kwargs)
-
         if data['status'] == 'ok':
             print('User Information Updated.')
         else:
             print('User Information Not Updated.')
+        return data['status'] == 'ok'
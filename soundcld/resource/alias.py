@@ -3,6 +3,7 @@ Aliases For Common Objects
 """
 from typing import Union
 
+from soundcld.resource.decoder import compile_union
 from soundcld.resource.like import TrackLike, PlaylistLike
 from soundcld.resource.playlist_album import AlbumPlaylist, BasicAlbumPlaylist
 from soundcld.resource.stream_repost import (
@@ -26,3 +27,17 @@ RepostItem = Union[TrackStreamRepostItem, PlaylistStreamRepostItem]
 StreamItem = Union[
     TrackStreamItem, TrackStreamRepostItem,
     PlaylistStreamItem, PlaylistStreamRepostItem]
+
+KINDS = {
+    'user': (User, BasicUser),
+    'track': (Track, BasicTrack, TrackStreamItem),
+    'playlist': (AlbumPlaylist, BasicAlbumPlaylist, PlaylistStreamItem),
+    'like': (TrackLike, PlaylistLike),
+    'playlist-repost': (PlaylistStreamRepostItem,),
+    'track-repost': (TrackStreamRepostItem,)
+}
+
+compile_union(SearchItem, KINDS, 'SearchItem')
+compile_union(Like, KINDS, 'Like')
+compile_union(RepostItem, KINDS, 'RepostItem')
+compile_union(StreamItem, KINDS, 'StreamItem')
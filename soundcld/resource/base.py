@@ -1,12 +1,16 @@
 """
 Base Object For SoundCloud
 """
-from dataclasses import dataclass, fields, is_dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Optional
 
-import dateutil.parser
-from dacite import Config, from_dict
+from dacite import Config
+
+from soundcld import jsoncodec
+from soundcld.resource.datetimes import parse_datetime
+from soundcld.resource.decoder import compile_decoder
+from soundcld.resource.encoder import compile_encoder, encode_value
 
 
 @dataclass
@@ -14,8 +18,9 @@ class BaseData:
     """
     Base Data Object
     """
+    __slots__ = ()
     dacite_config = Config(
-        type_hooks={datetime: dateutil.parser.isoparse},
+        type_hooks={datetime: parse_datetime},
         cast=[tuple]
     )
 
@@ -24,7 +29,7 @@ class BaseData:
         """
         Converts Given Dict To Given Class Object
         """
-        return from_dict(cls, d, cls.dacite_config)
+        return compile_decoder(cls)(d)
 
     def __getitem__(self, item):
         """
@@ -46,7 +51,21 @@ class BaseData:
         Return a generator of (field_name, value) tuples,
         converting dataclasses to dicts and datetime to ISO format.
         """
-        return ((field.name, self._convert_to_dict(getattr(self, field.name))) for field in fields(self))
+        return iter(compile_encoder(type(self))(self).items())
+
+    def to_dict(self, skip_none: bool = False) -> dict:
+        """
+        Converts Object To Dict Like items() Does,
+        Using Encoder Precompiled Per Class.
+        With skip_none Fields Which Are None Are Left Out.
+        """
+        return compile_encoder(type(self), skip_none)(self)
+
+    def to_json(self, skip_none: bool = False) -> str:
+        """
+        Converts Object To JSON String
+        """
+        return jsoncodec.dumps(compile_encoder(type(self), skip_none)(self)).decode('utf-8')
 
     def _convert_to_dict(self, value):
         """
@@ -54,14 +73,7 @@ class BaseData:
         dataclass objects to dictionaries recursively.
         Also handles datetime serialization (to ISO format).
         """
-        if isinstance(value, datetime):
-            return value.isoformat()
-        elif is_dataclass(value):
-            return {f.name: self._convert_to_dict(getattr(value, f.name)) for f in fields(value)}
-        elif isinstance(value, (list, tuple)):
-            return [self._convert_to_dict(v) for v in value]
-        else:
-            return value
+        return encode_value(value)
 
     def __iter__(self):
         """
@@ -0,0 +1,25 @@
+"""
+Datetime Helpers For SoundCloud Objects
+"""
+from datetime import datetime
+from functools import lru_cache
+
+import dateutil.parser
+import dateutil.tz
+
+UTC = dateutil.tz.tzutc()
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime:
+    """
+    Parses ISO-8601 Timestamp. Fixed 'YYYY-MM-DDTHH:MM:SSZ' Format
+    Which SoundCloud Returns Is Parsed Directly, Other Inputs
+    Go To dateutil. Repeated Timestamps Are Served From Cache.
+    """
+    if len(value) == 20 and value[19] == 'Z' and value[10] == 'T':
+        try:
+            return datetime.fromisoformat(value[:19]).replace(tzinfo=UTC)
+        except ValueError:
+            pass
+    return dateutil.parser.isoparse(value)
@@ -0,0 +1,290 @@
+"""
+Precompiled Decoders For SoundCloud Objects
+"""
+import threading
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+from dacite import DaciteError, MissingValueError, UnionMatchError, WrongTypeError
+from dacite.exceptions import DaciteFieldError
+
+from soundcld.resource.identity import interned
+
+Decoder = Callable[[Any], Any]
+
+_decoders: Dict[type, Decoder] = {}
+_unions: Dict[Any, 'UnionIndex'] = {}
+
+
+def compile_decoder(data_class: type) -> Decoder:
+    """
+    Returns Decoder Which Builds Given Dataclass From Dict.
+    Type Hints Are Inspected Once, Then Cached Per Class.
+    """
+    decoder = _decoders.get(data_class)
+    if decoder is None:
+        decoder = _build_decoder(data_class)
+        if getattr(data_class, 'identity_fields', None):
+            decoder = interned(data_class, decoder)
+        _decoders[data_class] = decoder
+    return decoder
+
+
+def register_decoder(data_class: type, decoder: Decoder) -> None:
+    """
+    Sets Decoder Used For Given Class Instead Of Compiled One
+    """
+    _decoders[data_class] = decoder
+
+
+def _is_optional(field_type) -> bool:
+    return get_origin(field_type) is Union and type(None) in get_args(field_type)
+
+
+def _strip_optional(field_type):
+    args = tuple(arg for arg in get_args(field_type) if arg is not type(None))
+    if len(args) == 1:
+        return args[0]
+    return Union[args]
+
+
+def _converter(field_type, hooks: dict) -> Optional[Decoder]:
+    """
+    Returns Callable Converting Raw Value Of Given Type,
+    Or None If Raw Value Can Be Used As It Is.
+    """
+    if field_type in hooks:
+        return hooks[field_type]
+    if is_dataclass(field_type):
+        return compile_decoder(field_type)
+    origin = get_origin(field_type)
+    if origin is Union:
+        if _is_optional(field_type):
+            inner = _converter(_strip_optional(field_type), hooks)
+            if inner is None:
+                return None
+            return lambda value: None if value is None else inner(value)
+        return _union_converter(field_type, hooks)
+    if origin in (tuple, list):
+        args = [arg for arg in get_args(field_type) if arg is not Ellipsis]
+        item = _converter(args[0], hooks) if args else None
+        if item is None:
+            return origin
+        return lambda value: origin([item(elem) for elem in value])
+    return None
+
+
+def _union_converter(union, hooks: dict) -> Decoder:
+    if all(is_dataclass(member) for member in get_args(union)):
+        return compile_union(union)
+    members = []
+    for member in get_args(union):
+        members.append((member, _converter(member, hooks)))
+
+    def convert_union(value):
+        for member, convert in members:
+            if convert is None:
+                if isinstance(value, member):
+                    return value
+                continue
+            try:
+                return convert(value)
+            except (DaciteError, KeyError, TypeError, ValueError):
+                continue
+        raise UnionMatchError(field_type=union, value=value)
+
+    return convert_union
+
+
+def compile_union(
+        union,
+        kinds: Dict[str, Tuple[type, ...]] = None,
+        name: str = None
+) -> 'UnionIndex':
+    """
+    Returns Discriminator Index Of Union Of Dataclasses.
+    Index Is Built Once Per Union, First Call Decides The Kinds Table.
+    """
+    index = _unions.get(union)
+    if index is None:
+        index = UnionIndex(union, kinds, name)
+        _unions[union] = index
+    return index
+
+
+def get_union(union) -> Optional['UnionIndex']:
+    """
+    Returns Already Built Index Of Union, If Any
+    """
+    return _unions.get(union)
+
+
+def union_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Returns Dispatch Counters Of Every Compiled Union
+    """
+    return {index.name: index.stats() for index in _unions.values()}
+
+
+def _signature(data_class: type, depth: int = 2) -> tuple:
+    """
+    Required Keys Of Dataclass, With Required Keys
+    Of Its Nested Dataclasses Up To Given Depth.
+    """
+    hints = get_type_hints(data_class)
+    keys = []
+    nested = []
+    for field in fields(data_class):
+        if not field.init or field.default is not MISSING or field.default_factory is not MISSING:
+            continue
+        field_type = hints[field.name]
+        if _is_optional(field_type):
+            continue
+        keys.append(field.name)
+        if depth and is_dataclass(field_type):
+            nested.append((field.name, _signature(field_type, depth - 1)))
+    return frozenset(keys), tuple(nested)
+
+
+def _matches(data, signature: tuple) -> bool:
+    keys, nested = signature
+    if not data.keys() >= keys:
+        return False
+    for name, inner in nested:
+        value = data[name]
+        if not isinstance(value, dict) or not _matches(value, inner):
+            return False
+    return True
+
+
+class UnionIndex:
+    """
+    Picks Concrete Class Of Union From Its 'type'/'kind' Value
+    And Presence Of Key Fields, So Each Item Is Decoded Once.
+    Items That Match No Signature Fall Back To Trial Decoding.
+    """
+
+    def __init__(self, union, kinds: Dict[str, Tuple[type, ...]] = None, name: str = None):
+        members = get_args(union)
+        self.name = name or str(union)
+        self.union = union
+        self.candidates = tuple((member, _signature(member)) for member in members)
+        self.kind_table = kinds
+        self.kinds = None
+        if kinds is not None:
+            self.kinds = {}
+            for kind, classes in kinds.items():
+                own = [member for member in classes if member in members] or list(classes)
+                self.kinds[kind] = tuple((member, _signature(member)) for member in own)
+        self.dispatched = self.fallbacks = self.failures = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, data):
+        if not isinstance(data, dict):
+            raise WrongTypeError(self.union, data)
+        candidates = self.candidates
+        if self.kinds is not None:
+            kind = data.get('kind', '')
+            if 'type' in data:
+                kind = data['type']
+            candidates = self.kinds.get(kind)
+            if not candidates:
+                self._count('failures')
+                raise UnionMatchError(field_type=self.union, value=data)
+        for member, signature in candidates:
+            if _matches(data, signature):
+                try:
+                    value = compile_decoder(member)(data)
+                except DaciteError:
+                    break
+                self._count('dispatched')
+                return value
+        self._count('fallbacks')
+        for member, _ in candidates:
+            try:
+                return compile_decoder(member)(data)
+            except DaciteError:
+                continue
+        self._count('failures')
+        raise UnionMatchError(field_type=self.union, value=data)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns Dispatch Counters
+        """
+        return {
+            'dispatched': self.dispatched,
+            'fallbacks': self.fallbacks,
+            'failures': self.failures
+        }
+
+
+def _build_decoder(data_class: type) -> Decoder:
+    hooks = dict(getattr(data_class, 'dacite_config').type_hooks)
+    hints = get_type_hints(data_class)
+    namespace = {
+        'cls': data_class,
+        'MissingValueError': MissingValueError,
+        'WrongTypeError': WrongTypeError,
+        'DaciteFieldError': DaciteFieldError,
+    }
+    lines = [
+        'def decode(data):',
+        '    if not isinstance(data, dict):',
+        '        raise WrongTypeError(cls, data)',
+        '    try:',
+    ]
+    args = []
+    for index, field in enumerate(fields(data_class)):
+        if not field.init:
+            continue
+        var = f'f{index}'
+        field_type = hints[field.name]
+        optional = _is_optional(field_type)
+        namespace[f't{index}'] = field_type
+        if field.default is not MISSING:
+            namespace[f'd{index}'] = field.default
+            lines.append(f'        {var} = data.get({field.name!r}, d{index})')
+        elif field.default_factory is not MISSING:
+            namespace[f'd{index}'] = field.default_factory
+            lines.append(f'        {var} = data[{field.name!r}] if {field.name!r} in data else d{index}()')
+        elif optional:
+            lines.append(f'        {var} = data.get({field.name!r})')
+        else:
+            lines.append(f'        {var} = data[{field.name!r}]')
+        convert = _converter(_strip_optional(field_type) if optional else field_type, hooks)
+        if optional:
+            if convert is not None:
+                lines.append(f'        if {var} is not None:')
+                lines.extend(_convert_lines(index, field.name, '            '))
+        else:
+            lines.append(f'        if {var} is None:')
+            lines.append(f'            raise WrongTypeError(t{index}, None, {field.name!r})')
+            if convert is not None:
+                lines.extend(_convert_lines(index, field.name, '        '))
+        if convert is not None:
+            namespace[f'c{index}'] = convert
+        args.append(var)
+    lines.extend([
+        '    except KeyError as err:',
+        '        raise MissingValueError(err.args[0]) from None',
+        f'    return cls({", ".join(args)})',
+    ])
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    decoder = namespace['decode']
+    decoder.__qualname__ = f'decode_{data_class.__name__}'
+    return decoder
+
+
+def _convert_lines(index: int, name: str, indent: str):
+    return [
+        f'{indent}try:',
+        f'{indent}    f{index} = c{index}(f{index})',
+        f'{indent}except DaciteFieldError as err:',
+        f'{indent}    err.update_path({name!r})',
+        f'{indent}    raise',
+    ]
@@ -0,0 +1,134 @@
+"""
+Precompiled Encoders For SoundCloud Objects
+"""
+import keyword
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple, Union, get_args, get_origin, get_type_hints
+
+Encoder = Callable[[Any], Dict[str, Any]]
+
+_encoders: Dict[Tuple[type, bool], Encoder] = {}
+_SCALARS = (str, int, float, bool)
+
+
+def compile_encoder(data_class: type, skip_none: bool = False) -> Encoder:
+    """
+    Returns Encoder Which Converts Object Of Given Dataclass To Dict,
+    Nested Objects To Dicts, Tuples To Lists And Datetimes To ISO Format.
+    Field Table Is Built Once, Then Cached Per Class.
+    """
+    encoder = _encoders.get((data_class, skip_none))
+    if encoder is None:
+        encoder = _build_encoder(data_class, skip_none)
+        _encoders[(data_class, skip_none)] = encoder
+    return encoder
+
+
+def encode_value(value, skip_none: bool = False):
+    """
+    Converts Any Value Like Encoders Do, Checking Its Type At Runtime
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return compile_encoder(type(value), skip_none)(value)
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item, skip_none) for item in value]
+    return value
+
+
+def _datetime(value):
+    return None if value is None else value.isoformat()
+
+
+def _nested(skip_none: bool) -> Callable[[Any], Any]:
+    encoders = _encoders
+
+    def encode_nested(value):
+        if value is None:
+            return None
+        encoder = encoders.get((type(value), skip_none))
+        if encoder is None:
+            return encode_value(value, skip_none)
+        return encoder(value)
+
+    return encode_nested
+
+
+def _nested_list(skip_none: bool) -> Callable[[Any], Any]:
+    encode_nested = _nested(skip_none)
+
+    def encode_list(value):
+        if value is None:
+            return None
+        return [encode_nested(item) for item in value]
+
+    return encode_list
+
+
+def _scalar_list(value):
+    return None if value is None else list(value)
+
+
+def _is_resource(field_type) -> bool:
+    if get_origin(field_type) is Union:
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        return bool(args) and all(is_dataclass(arg) for arg in args)
+    return isinstance(field_type, type) and is_dataclass(field_type)
+
+
+def _field_converter(field_type):
+    """
+    Returns Name Of Converter For Field Of Given Type,
+    Or None If Value Can Be Used As It Is.
+    """
+    if get_origin(field_type) is Union:
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(args) == 1:
+            field_type = args[0]
+    if field_type in _SCALARS:
+        return None
+    if field_type is datetime:
+        return 'iso'
+    if _is_resource(field_type):
+        return 'nested'
+    if get_origin(field_type) in (tuple, list):
+        args = [arg for arg in get_args(field_type) if arg is not Ellipsis]
+        if args and all(arg in _SCALARS for arg in args):
+            return 'scalars'
+        if args and all(_is_resource(arg) for arg in args):
+            return 'nested_list'
+    return 'value'
+
+
+def _build_encoder(data_class: type, skip_none: bool) -> Encoder:
+    hints = get_type_hints(data_class)
+    namespace = {
+        'iso': _datetime,
+        'nested': _nested(skip_none),
+        'nested_list': _nested_list(skip_none),
+        'scalars': _scalar_list,
+        'value': lambda value: encode_value(value, skip_none),
+    }
+    items = []
+    for field in fields(data_class):
+        convert = _field_converter(hints[field.name])
+        value = f'obj.{field.name}'
+        if keyword.iskeyword(field.name):
+            value = f'getattr(obj, {field.name!r})'
+        if convert is not None:
+            value = f'{convert}({value})'
+        items.append(f'{field.name!r}: {value}')
+    lines = [
+        'def encode(obj):',
+        f'    data = {{{", ".join(items)}}}',
+    ]
+    if skip_none:
+        lines.append('    return {key: value for key, value in data.items() if value is not None}')
+    else:
+        lines.append('    return data')
+    exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+    encoder = namespace['encode']
+    encoder.__qualname__ = f'encode_{data_class.__name__}'
+    return encoder
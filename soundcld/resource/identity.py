@@ -0,0 +1,89 @@
+"""
+Identity Map Of Decoded SoundCloud Objects
+"""
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Optional
+
+current_identity_map: ContextVar[Optional['IdentityMap']] = ContextVar('current_identity_map', default=None)
+
+
+class IdentityMap:
+    """
+    LRU Bounded Map Which Returns Already Decoded Object
+    For Repeated Payloads Of Same Object, For Example
+    Same Uploader Referenced By Every Track Of A Page.
+    Shared Objects Are The Same Instance, So Mutating One Changes All.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._objects = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable, decode: Callable[[], Any]) -> Any:
+        """
+        Returns Object Stored Under Key, Or Decodes And Stores It
+        """
+        with self._lock:
+            value = self._objects.get(key)
+            if value is not None:
+                self._objects.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = decode()
+        with self._lock:
+            self._objects[key] = value
+            self._objects.move_to_end(key)
+            while len(self._objects) > self.maxsize:
+                self._objects.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """
+        Removes All Stored Objects And Resets Statistics
+        """
+        with self._lock:
+            self._objects.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns Hit/Miss Statistics
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._objects),
+            'maxsize': self.maxsize
+        }
+
+
+def _freeze(value) -> Hashable:
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in sorted(value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def interned(data_class: type, decode: Callable[[dict], Any]) -> Callable[[dict], Any]:
+    """
+    Wraps Decoder Of Class Which Declares identity_fields,
+    So Payloads With Same Identity Share One Decoded Object
+    While Identity Map Is Active.
+    """
+    identity_fields = data_class.identity_fields
+
+    def decode_interned(data):
+        identity_map = current_identity_map.get()
+        if identity_map is None or not isinstance(data, dict):
+            return decode(data)
+        key = (data_class,) + tuple(_freeze(data.get(name)) for name in identity_fields)
+        return identity_map.lookup(key, lambda: decode(data))
+
+    decode_interned.__qualname__ = decode.__qualname__
+    return decode_interned
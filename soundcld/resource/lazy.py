@@ -0,0 +1,163 @@
+"""
+Lazily Decoded Variants Of SoundCloud Objects
+"""
+import threading
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+from dacite import MissingValueError, WrongTypeError
+from dacite.exceptions import DaciteFieldError
+
+from soundcld.resource.base import BaseData
+from soundcld.resource.decoder import (
+    _converter,
+    _is_optional,
+    _strip_optional,
+    compile_union,
+    get_union,
+    register_decoder
+)
+from soundcld.resource.identity import interned
+
+_lazy: Dict[type, type] = {}
+_lock = threading.RLock()
+
+
+class LazyField:
+    """
+    Non-Data Descriptor Which Reads Field From Raw Dict
+    On First Access, Decoding It If Needed, And Stores Result
+    In Instance, So Later Accesses Are Plain Attribute Lookups.
+    """
+    __slots__ = ('name', 'convert', 'default', 'factory', 'field_type')
+
+    def __init__(
+            self,
+            name: str,
+            convert: Optional[Callable[[Any], Any]],
+            default: Any = None,
+            factory: Callable[[], Any] = None,
+            field_type=None
+    ):
+        self.name = name
+        self.convert = convert
+        self.default = default
+        self.factory = factory
+        self.field_type = field_type
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        state = instance.__dict__
+        raw = state['_raw']
+        if self.name in raw:
+            value = raw[self.name]
+            if value is None:
+                if self.field_type is not None:
+                    raise WrongTypeError(self.field_type, None, self.name)
+            elif self.convert is not None:
+                try:
+                    value = self.convert(value)
+                except DaciteFieldError as err:
+                    err.update_path(self.name)
+                    raise
+        elif self.factory is not None:
+            value = self.factory()
+        else:
+            value = self.default
+        state[self.name] = value
+        return value
+
+
+def lazy(data_class: type) -> type:
+    """
+    Returns Lazy Variant Of Given Resource Class.
+    Variant Is Subclass Of Given Class Which Keeps Raw Dict And
+    Reads Fields, Nested Objects And Datetimes On First Access Only.
+    Missing Required Keys Are Still Checked On Decoding,
+    Other Errors (None Values, Nested Objects) Are Raised On Access.
+    """
+    variant = _lazy.get(data_class)
+    if variant is not None:
+        return variant
+    if data_class in _lazy.values() or not _has_dict(data_class):
+        return data_class
+    with _lock:
+        variant = _lazy.get(data_class)
+        if variant is not None:
+            return variant
+        name = f'Lazy{data_class.__name__}'
+        variant = type(name, (data_class,), {
+            '__module__': __name__,
+            '__qualname__': name,
+            '__doc__': data_class.__doc__,
+        })
+        _lazy[data_class] = variant
+        decoder = _build_lazy_decoder(variant, data_class)
+        if getattr(data_class, 'identity_fields', None):
+            decoder = interned(variant, decoder)
+        register_decoder(variant, decoder)
+        return variant
+
+
+def _has_dict(data_class: type) -> bool:
+    return any('__slots__' not in klass.__dict__ for klass in data_class.__mro__[:-1])
+
+
+def lazy_type(field_type):
+    """
+    Replaces Resource Classes In Given Type With Their Lazy Variants
+    """
+    if isinstance(field_type, type) and is_dataclass(field_type) and issubclass(field_type, BaseData):
+        return lazy(field_type)
+    origin = get_origin(field_type)
+    if origin is Union:
+        union = Union[tuple(lazy_type(arg) for arg in get_args(field_type))]
+        index = get_union(field_type)
+        if index is not None and index.kind_table is not None:
+            kinds = {
+                kind: tuple(lazy(member) for member in members)
+                for kind, members in index.kind_table.items()
+            }
+            compile_union(union, kinds, f'Lazy{index.name}')
+        return union
+    if origin is tuple:
+        args = get_args(field_type)
+        if len(args) == 2 and args[1] is Ellipsis:
+            return Tuple[lazy_type(args[0]), ...]
+        return Tuple[tuple(lazy_type(arg) for arg in args)]
+    return field_type
+
+
+def _build_lazy_decoder(variant: type, data_class: type) -> Callable[[Any], Any]:
+    hooks = dict(getattr(data_class, 'dacite_config').type_hooks)
+    hints = get_type_hints(data_class)
+    required = []
+    for field in fields(data_class):
+        if not field.init:
+            continue
+        field_type = hints[field.name]
+        optional = _is_optional(field_type)
+        default = None if field.default is MISSING else field.default
+        factory = None if field.default_factory is MISSING else field.default_factory
+        if optional or field.default is not MISSING or factory is not None:
+            field_type = None
+        else:
+            required.append(field.name)
+        convert = _converter(lazy_type(_strip_optional(hints[field.name]) if optional else hints[field.name]), hooks)
+        setattr(variant, field.name, LazyField(field.name, convert, default, factory, field_type))
+    required = tuple(required)
+    required_keys = frozenset(required)
+    new = object.__new__
+
+    def decode(data):
+        if not isinstance(data, dict):
+            raise WrongTypeError(variant, data)
+        if not required_keys <= data.keys():
+            raise MissingValueError(next(name for name in required if name not in data))
+        instance = new(variant)
+        instance.__dict__['_raw'] = data
+        return instance
+
+    decode.__qualname__ = f'decode_{variant.__name__}'
+    return decode
@@ -0,0 +1,133 @@
+"""
+Memory-Compact Slotted Variants Of SoundCloud Objects
+"""
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Dict, Tuple, Union, get_args, get_origin, get_type_hints
+
+from soundcld.resource.alias import SearchItem, Like, RepostItem, StreamItem
+from soundcld.resource.base import BaseData, BaseItem
+from soundcld.resource.comment import Comment, BasicComment, CommentSelf
+from soundcld.resource.conversation import Conversation
+from soundcld.resource.decoder import compile_union, get_union
+from soundcld.resource.like import TrackLike, PlaylistLike
+from soundcld.resource.message import Message
+from soundcld.resource.playlist_album import (
+    AlbumPlaylist,
+    BasicAlbumPlaylist,
+    AlbumPlaylistNoTracks
+)
+from soundcld.resource.stream_repost import (
+    TrackStreamItem,
+    TrackStreamRepostItem,
+    PlaylistStreamItem,
+    PlaylistStreamRepostItem
+)
+from soundcld.resource.track import (
+    Track,
+    BasicTrack,
+    BaseTrack,
+    MiniTrack,
+    CommentTrack,
+    Transcoding,
+    Format,
+    Media
+)
+from soundcld.resource.user import User, BasicUser, MissingUser, Badges
+from soundcld.resource.visual import Visual, Visuals
+from soundcld.resource.webprofile import WebProfile
+
+_slotted: Dict[type, type] = {}
+
+
+def slotted(data_class: type) -> type:
+    """
+    Returns Slotted Variant Of Given Resource Class.
+    Variant Has Same Fields, Nested Objects Are Slotted Too,
+    And Keeps BaseData Api ([] Access, items(), from_dict()).
+    """
+    variant = _slotted.get(data_class)
+    if variant is not None:
+        return variant
+    if data_class in _slotted.values():
+        return data_class
+    base = data_class.__bases__[0]
+    slotted_base = BaseData if base is BaseData else slotted(base)
+    hints = get_type_hints(data_class)
+    inherited = {field.name for field in fields(base)} if base is not BaseData else set()
+    own = data_class.__dict__.get('__annotations__', {})
+    annotations = {name: slotted_type(hints[name]) for name in own}
+    name = f'Slotted{data_class.__name__}'
+    namespace = {
+        '__slots__': tuple(item for item in annotations if item not in inherited),
+        '__annotations__': annotations,
+        '__module__': __name__,
+        '__qualname__': name,
+        '__doc__': data_class.__doc__,
+    }
+    if 'identity_fields' in data_class.__dict__:
+        namespace['identity_fields'] = data_class.identity_fields
+    variant = dataclass(type(name, (slotted_base,), namespace))
+    _slotted[data_class] = variant
+    return variant
+
+
+def slotted_type(field_type):
+    """
+    Replaces Resource Classes In Given Type With Their Slotted Variants
+    """
+    if isinstance(field_type, type) and is_dataclass(field_type) and issubclass(field_type, BaseData):
+        return slotted(field_type)
+    origin = get_origin(field_type)
+    if origin is Union:
+        union = Union[tuple(slotted_type(arg) for arg in get_args(field_type))]
+        index = get_union(field_type)
+        if index is not None and index.kind_table is not None:
+            kinds = {
+                kind: tuple(slotted(member) for member in members)
+                for kind, members in index.kind_table.items()
+            }
+            compile_union(union, kinds, f'Slotted{index.name}')
+        return union
+    if origin is tuple:
+        args = get_args(field_type)
+        if len(args) == 2 and args[1] is Ellipsis:
+            return Tuple[slotted_type(args[0]), ...]
+        return Tuple[tuple(slotted_type(arg) for arg in args)]
+    return field_type
+
+
+SlottedBaseItem = slotted(BaseItem)
+SlottedBaseTrack = slotted(BaseTrack)
+SlottedTrack = slotted(Track)
+SlottedBasicTrack = slotted(BasicTrack)
+SlottedMiniTrack = slotted(MiniTrack)
+SlottedCommentTrack = slotted(CommentTrack)
+SlottedTranscoding = slotted(Transcoding)
+SlottedFormat = slotted(Format)
+SlottedMedia = slotted(Media)
+SlottedUser = slotted(User)
+SlottedBasicUser = slotted(BasicUser)
+SlottedMissingUser = slotted(MissingUser)
+SlottedBadges = slotted(Badges)
+SlottedVisual = slotted(Visual)
+SlottedVisuals = slotted(Visuals)
+SlottedAlbumPlaylist = slotted(AlbumPlaylist)
+SlottedBasicAlbumPlaylist = slotted(BasicAlbumPlaylist)
+SlottedAlbumPlaylistNoTracks = slotted(AlbumPlaylistNoTracks)
+SlottedComment = slotted(Comment)
+SlottedBasicComment = slotted(BasicComment)
+SlottedCommentSelf = slotted(CommentSelf)
+SlottedConversation = slotted(Conversation)
+SlottedMessage = slotted(Message)
+SlottedTrackLike = slotted(TrackLike)
+SlottedPlaylistLike = slotted(PlaylistLike)
+SlottedTrackStreamItem = slotted(TrackStreamItem)
+SlottedTrackStreamRepostItem = slotted(TrackStreamRepostItem)
+SlottedPlaylistStreamItem = slotted(PlaylistStreamItem)
+SlottedPlaylistStreamRepostItem = slotted(PlaylistStreamRepostItem)
+SlottedWebProfile = slotted(WebProfile)
+
+SlottedSearchItem = slotted_type(SearchItem)
+SlottedLike = slotted_type(Like)
+SlottedRepostItem = slotted_type(RepostItem)
+SlottedStreamItem = slotted_type(StreamItem)
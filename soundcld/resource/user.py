@@ -30,6 +30,7 @@ class Badges(BaseData):
     """
     User Badges
     """
+    identity_fields = ('pro', 'pro_unlimited', 'verified')
     pro: bool
     pro_unlimited: bool
     verified: bool
@@ -40,6 +41,7 @@ class BasicUser(BaseData):
     """
     User With Partial Information
     """
+    identity_fields = ('kind', 'id', 'last_modified')
     avatar_url: Optional[str]
     first_name: Optional[str]
     followers_count: Optional[int]
@@ -23,6 +23,7 @@ class Visuals(BaseData):
     Visual Background Img For Track,
     Playlist And Their User's Profile Visual.
     """
+    identity_fields = ('urn', 'enabled', 'tracking', 'visuals')
     urn: str
     enabled: bool
     tracking: Optional[str]
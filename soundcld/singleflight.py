@@ -0,0 +1,64 @@
+"""
+Request Coalescing Of SoundCld
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs Only One Call Per Key At A Time.
+    Threads Asking For Same Key While Call Is In Flight
+    Wait For It And Get Its Result (Or Its Exception).
+    """
+
+    def __init__(self):
+        self.calls = self.saved = 0
+        self._flights: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Returns Result Of func, Shared With Concurrent Callers Of Same Key
+        """
+        with self._lock:
+            call = self._flights.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._flights[key] = call
+                self.calls += 1
+            else:
+                call.waiters += 1
+                self.saved += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns Number Of Executed Calls And Of Calls Saved By Coalescing
+        """
+        return {'calls': self.calls, 'saved': self.saved, 'in_flight': len(self._flights)}
@@ -0,0 +1,135 @@
+"""
+Persistent State Of SoundCld (data.json, cookies.json)
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+_stores = weakref.WeakSet()
+_MISSING = object()
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Holds Exclusive Lock On '<path>.lock' While Inside,
+    Shared By All Processes Using Same State File
+    """
+    with open(f'{path}.lock', 'a+b') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    """
+    Writes JSON To Temp File Next To Path, Then Renames It Over Path
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False
+    ) as file:
+        json.dump(data, file, indent=4)
+    os.replace(file.name, path)
+
+
+class StateStore:
+    """
+    JSON File Whose Changes Are Collected In Memory And Written
+    flush_interval Seconds After First Change (Or On flush/Exit).
+    Writes Are Atomic And Merged Under Inter-Process File Lock,
+    So Keys Changed By Other Processes Are Kept.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.writes = 0
+        self._pending: Dict[str, Any] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        _stores.add(self)
+
+    def exists(self) -> bool:
+        """
+        Returns True If State File Exists
+        """
+        return os.path.exists(self.path)
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Returns Stored State With Pending Changes Applied
+        """
+        with self._lock:
+            data = self._read()
+            data.update(self._pending)
+            return data
+
+    def update(self, changes: Dict[str, Any]) -> None:
+        """
+        Stages Changes To Be Written On Next Flush
+        """
+        with self._lock:
+            self._pending.update(changes)
+            if self.flush_interval <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Writes Pending Changes Now
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            with file_lock(self.path):
+                data = self._read()
+                changed = {key: value for key, value in self._pending.items() if data.get(key, _MISSING) != value}
+                if changed or not os.path.exists(self.path):
+                    data.update(changed)
+                    write_json_atomic(self.path, data)
+                    self.writes += 1
+            self._pending.clear()
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+
+@atexit.register
+def _flush_all() -> None:
+    for store in list(_stores):
+        store.flush()
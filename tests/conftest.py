@@ -0,0 +1,37 @@
+import http.server
+import json
+import threading
+
+import pytest
+
+import soundcld.api_handler
+from helpers import PAGE, StubHandler
+
+
+@pytest.fixture
+def stub_server():
+    with open(PAGE, 'r', encoding='utf-8') as file:
+        StubHandler.track = json.load(file)['collection'][0]
+    StubHandler.reset()
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    conf = tmp_path / 'data.json'
+    cookies = tmp_path / 'cookies.json'
+    conf.write_text(json.dumps({'user_id': 'user', 'client_id': 'client', 'app_version': '1'}))
+    cookies.write_text(json.dumps({
+        'moe_uuid': 'moe',
+        'oauth_token': '2-123-456-token',
+        'sc_anonymous_id': 'anon',
+        'datadome': 'dd-0'
+    }))
+    monkeypatch.setattr(soundcld.api_handler, 'confDirectory', str(conf))
+    monkeypatch.setattr(soundcld.api_handler, 'cookieDirectory', str(cookies))
+    return conf
@@ -0,0 +1,249 @@
+"""
+Shared Helpers Of Offline Tests
+"""
+import http.server
+import json
+import os
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from soundcld.request_handler import CollectionGetReq
+from soundcld.resource.base import BaseData
+
+PAGE = os.path.join(os.path.dirname(__file__), 'data', 'tracks_page.json')
+
+
+@dataclass
+class Item(BaseData):
+    """
+    Minimal Resource For Offline Tests
+    """
+    id: int
+
+
+def make_client(**kwargs):
+    data = {'client_id': 'client', 'app_version': '1', 'user_id': 'user'}
+    options = {'prefetch': 0, 'slotted': False, 'lazy_models': False, 'identity_map': None, 'cache': None,
+               'inflight': None, 'cookie_lock': threading.RLock(), 'api_base': None}
+    options.update(kwargs)
+    return SimpleNamespace(data=data, **options)
+
+
+class FakeResponse:
+    """
+    Response Of Fake Transport
+    """
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = ''
+        self.content = b''
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class PagedReq(CollectionGetReq):
+    """
+    CollectionGetReq Served From In-Memory Pages, Recording Loaded Pages
+    In client.loaded And Failing Once On client.fail_page If It Is Set
+    """
+    page_count = 5
+    extra = {}
+
+    def _load_href(self, url, param):
+        page = 0 if '?page=' not in url else int(url.split('?page=')[1])
+        if page == getattr(self.client, 'fail_page', None):
+            self.client.fail_page = None
+            raise ConnectionError('interrupted')
+        self.client.loaded.append(page)
+        next_href = None
+        if page + 1 < self.page_count:
+            next_href = f'{self.base}/items?page={page + 1}'
+        return {
+            'collection': [dict(self.extra, id=page * 10 + i) for i in range(10)],
+            'next_href': next_href
+        }
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Local SoundCloud Stub Which Records Malformed Requests
+    And x-datadome-clientid Of Mutations In datadomes.
+    playlists Maps Playlist ID To (Version, Track IDs), PUT Replaces Tracks.
+    set_cookie Is Sent As Set-Cookie With GET Responses.
+    statuses Maps (Method, Path) To Planned Statuses Of Next Requests,
+    None Serves Request As Usual And 0 Drops Connection.
+    GET /tracks?ids= Skips deleted IDs, Each Batch Takes delay Seconds.
+    pages Maps Collection Path To Its Page Count
+    """
+    protocol_version = 'HTTP/1.1'
+    track = None
+    errors = []
+    requests = []
+    peers = []
+    bodies = []
+    cookies = []
+    sent = []
+    datadomes = []
+    playlists = {}
+    statuses = {}
+    deleted = set()
+    pages = {}
+    delay = 0
+    active = peak = 0
+    set_cookie = None
+    datadome = iter(range(1, 10 ** 6))
+    lock = threading.Lock()
+
+    @classmethod
+    def reset(cls):
+        cls.errors = []
+        cls.requests = []
+        cls.peers = []
+        cls.bodies = []
+        cls.cookies = []
+        cls.sent = []
+        cls.datadomes = []
+        cls.playlists = {}
+        cls.statuses = {}
+        cls.deleted = set()
+        cls.pages = {}
+        cls.delay = 0
+        cls.active = cls.peak = 0
+        cls.set_cookie = None
+
+    def _send(self, body, set_datadome=False):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        if self.set_cookie and self.command == 'GET':
+            self.send_header('Set-Cookie', self.set_cookie)
+        if set_datadome:
+            with self.lock:
+                value = next(self.datadome)
+            self.send_header('x-set-cookie', f'datadome=dd-{value}; Path=/')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _planned(self):
+        """
+        Records Request And Answers It With Its Planned Status If There Is One
+        """
+        path = self.path.split('?')[0]
+        with self.lock:
+            self.sent.append((self.command, path))
+            planned = self.statuses.get((self.command, path))
+            status = planned.pop(0) if planned else None
+        if status is None:
+            return False
+        self.close_connection = True
+        if status:
+            self.send_response(status)
+            if status == 429:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+        return True
+
+    def _error(self, message):
+        with self.lock:
+            self.errors.append(f'{self.command} {self.path}: {message}')
+
+    def do_GET(self):
+        with self.lock:
+            self.requests.append(self.path)
+            self.peers.append(self.client_address)
+            self.cookies.append(self.headers.get('Cookie'))
+        if self._planned():
+            return
+        if 'client_id=stale' in self.path:
+            self.send_response(401)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if 'Content-Length' in self.headers or 'x-datadome-clientid' in self.headers:
+            self._error('complex request headers leaked into GET')
+        path, _, query = self.path.partition('?')
+        query = urllib.parse.parse_qs(query)
+        if path == '/tracks' and 'ids' in query:
+            return self._send(self._track_batch([int(i) for i in query['ids'][0].split(',')]))
+        if path in self.pages:
+            return self._send(self._page(path, int(query.get('page', ['0'])[0])))
+        if path.startswith('/tracks/'):
+            return self._send(dict(self.track, id=int(path.split('/')[2])))
+        if path.startswith('/playlists/'):
+            return self._send(self._playlist(int(path.split('/')[2])))
+        return self._send({'collection': []})
+
+    def _track_batch(self, track_ids):
+        with self.lock:
+            StubHandler.active += 1
+            StubHandler.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            StubHandler.active -= 1
+        return [dict(self.track, id=track_id) for track_id in reversed(track_ids) if track_id not in self.deleted]
+
+    def _page(self, path, page):
+        next_href = None
+        if page + 1 < self.pages[path]:
+            host, port = self.server.server_address
+            next_href = f'http://{host}:{port}{path}?page={page + 1}'
+        return {'collection': [{'id': page}], 'next_href': next_href}
+
+    def _playlist(self, playlist_id):
+        with self.lock:
+            version, track_ids = self.playlists[playlist_id]
+        return {
+            'id': playlist_id,
+            'kind': 'playlist',
+            'last_modified': f'2024-01-01T00:00:{version:02d}Z',
+            'permalink_url': 'https://soundcloud.com/me/sets/old',
+            'release_date': None,
+            'title': 'old',
+            'tracks': [{'id': track_id} for track_id in track_ids]
+        }
+
+    def do_OPTIONS(self):
+        if not self._planned():
+            self._send({})
+
+    def _mutation(self):
+        if self._planned():
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if len(body) != length:
+            self._error('bogus Content-Length')
+        if not self.headers.get('x-datadome-clientid', '').startswith('dd-'):
+            self._error('missing datadome client id')
+        data = json.loads(body) if body else {}
+        path = self.path.split('?')[0]
+        with self.lock:
+            self.bodies.append((self.command, path, data))
+            self.datadomes.append(self.headers.get('x-datadome-clientid'))
+        if self.command == 'PUT' and path.startswith('/playlists/'):
+            playlist_id = int(path.split('/')[2])
+            with self.lock:
+                version = self.playlists[playlist_id][0]
+                self.playlists[playlist_id] = (version + 1, data.get('playlist', data)['tracks'])
+            return self._send(self._playlist(playlist_id), set_datadome=True)
+        self._send({}, set_datadome=True)
+
+    do_PUT = do_DELETE = do_POST = _mutation
+
+    def log_message(self, *args):
+        pass
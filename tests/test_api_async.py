@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from soundcld import AsyncSoundCloud
+from soundcld.resource import BasicTrack, User, BasicUser
+
+
+@pytest.fixture
+def soundcloud_client():
+    track_id = 1727047206
+    client = AsyncSoundCloud()
+    return client, track_id
+
+def test_get_track(soundcloud_client):
+    client, track_id = soundcloud_client
+
+    async def run():
+        async with client:
+            return await client.get_track(track_id)
+
+    track = asyncio.run(run())
+    print(track)
+    assert isinstance(track, BasicTrack)
+
+def test_get_tracks_concurrently(soundcloud_client):
+    tracks_ids = [
+        1703966532,
+        1703966559,
+        1703966610
+    ]
+    client, track_id = soundcloud_client
+
+    async def run():
+        async with client:
+            return await asyncio.gather(*[client.get_track(its) for its in tracks_ids])
+
+    tracks = asyncio.run(run())
+    for track in tracks:
+        print(track)
+        assert isinstance(track, BasicTrack)
+
+def test_get_track_liker(soundcloud_client):
+    client, track_id = soundcloud_client
+
+    async def run():
+        async with client:
+            return [user async for user in client.get_track_liker(track_id)]
+
+    for user in asyncio.run(run()):
+        print(user)
+        assert isinstance(user, (User, BasicUser))
+
+if __name__ == '__main__':
+    pytest.main()
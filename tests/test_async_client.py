@@ -0,0 +1,104 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from helpers import StubHandler
+from soundcld import AsyncSoundCloud, SoundCloud
+from soundcld.resource import BasicTrack
+
+
+def test_non_lazy_async_client_validates_over_sync_session(stub_server, config):
+    client = AsyncSoundCloud(auth=True, api_base=stub_server)
+    assert any(path.startswith('/tracks/1727047206') for path in StubHandler.requests)
+    assert client.async_session is None
+
+    async def run():
+        async with client:
+            logged_in = await client.is_logged_in()
+            return logged_in, await client.get_track(5)
+
+    logged_in, track = asyncio.run(run())
+    assert logged_in
+    assert isinstance(track, BasicTrack) and track.id == 5
+    assert StubHandler.errors == []
+
+
+def test_async_session_does_not_resend_server_cookies(stub_server, config):
+    StubHandler.set_cookie = 'datadome=fromserver; Path=/'
+    client = AsyncSoundCloud(auth=True, lazy=True, api_base=stub_server.replace('127.0.0.1', 'localhost'))
+
+    async def run():
+        async with client:
+            for track_id in range(1, 4):
+                await client.get_track(track_id)
+            return len(client.async_session.cookie_jar)
+
+    assert asyncio.run(run()) == 0
+    assert [cookie.count('datadome=') for cookie in StubHandler.cookies] == [1, 1, 1]
+
+
+def test_async_query_is_sent_as_sync_one(stub_server, config, capsys):
+    SoundCloud(lazy=True, api_base=stub_server).get_tracks([1, 2])
+    client = AsyncSoundCloud(lazy=True, api_base=stub_server)
+
+    async def run():
+        async with client:
+            await client.get_tracks([1, 2])
+
+    asyncio.run(run())
+    capsys.readouterr()
+    sync_path, async_path = [path for path in StubHandler.requests if path.startswith('/tracks?')]
+    assert 'ids=1%2C2' in async_path
+    assert async_path == sync_path
+
+
+def test_missing_client_id_is_generated_off_event_loop(stub_server, config, capsys):
+    config.write_text(json.dumps({'user_id': 'user', 'client_id': None, 'app_version': '1'}))
+    client = AsyncSoundCloud(api_base=stub_server, lazy=True)
+    threads = []
+
+    def generate_client_id():
+        threads.append(threading.current_thread())
+        client.data['client_id'] = 'fresh'
+
+    client.generate_client_id = generate_client_id
+
+    async def run():
+        async with client:
+            return await client.get_track(3)
+
+    assert asyncio.run(run()).id == 3
+    capsys.readouterr()
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
+    assert 'client_id=fresh' in StubHandler.requests[-1]
+
+
+def test_lazy_async_client_refreshes_rejected_client_id(stub_server, config, capsys):
+    config.write_text(json.dumps({'user_id': 'user', 'client_id': 'stale', 'app_version': '1'}))
+    client = AsyncSoundCloud(api_base=stub_server, lazy=True)
+    generated = []
+
+    def generate_client_id():
+        generated.append(client.data['client_id'])
+        client.data['client_id'] = 'fresh'
+        assert client.is_client_id_valid()
+
+    client.generate_client_id = generate_client_id
+
+    async def run():
+        async with client:
+            return await asyncio.gather(*(client.get_track(track_id) for track_id in range(8)))
+
+    tracks = asyncio.run(run())
+    capsys.readouterr()
+    assert generated == ['stale']
+    assert [track.id for track in tracks] == list(range(8))
+    assert json.loads(config.read_text())['client_id'] == 'fresh'
+
+
+if __name__ == '__main__':
+    pytest.main()
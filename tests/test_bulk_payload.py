@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from helpers import StubHandler
+from soundcld import SoundCloud
+
+
+@pytest.fixture
+def client(stub_server, config, capsys):
+    sound = SoundCloud(auth=True, lazy=True, api_base=stub_server)
+    yield sound
+    sound.close()
+    capsys.readouterr()
+
+
+def sent(method):
+    return [path for command, path, _ in StubHandler.bodies if command == method]
+
+
+def test_bulk_like_reports_per_id_and_saves_cookies_once(client, tmp_path):
+    StubHandler.statuses[('PUT', '/users/456/track_likes/3')] = [404]
+    report = client.like_tracks([1, 2, 3, 4, 2])
+    assert report == {1: True, 2: True, 3: False, 4: True}
+    assert sorted(sent('PUT')) == [f'/users/456/track_likes/{i}' for i in (1, 2, 4)]
+    assert client.cookies['datadome'] != 'dd-0'
+    assert 'x-datadome-clientid' not in client.headers
+    client.flush()
+    assert client.cookie_store.writes == 1
+    saved = json.loads((tmp_path / 'cookies.json').read_text())
+    assert saved['datadome'] == client.cookies['datadome']
+    assert StubHandler.errors == []
+
+
+def test_bulk_unrepost_uses_delete(client):
+    assert client.unrepost_tracks([5, 6], max_workers=1) == {5: True, 6: True}
+    assert sent('DELETE') == ['/me/track_reposts/5', '/me/track_reposts/6']
+    assert StubHandler.datadomes[0] == 'dd-0'
+    assert StubHandler.datadomes[1] != 'dd-0'
+
+
+def test_bulk_playlist_reposts(client):
+    StubHandler.statuses[('DELETE', '/me/playlist_reposts/8')] = [404]
+    assert client.repost_playlists([7, 8], max_workers=1) == {7: True, 8: True}
+    assert client.unrepost_playlists([8, 7], max_workers=1) == {8: False, 7: True}
+    assert sent('PUT') == ['/me/playlist_reposts/7', '/me/playlist_reposts/8']
+    assert sent('DELETE') == ['/me/playlist_reposts/7']
+
+
+def test_bulk_empty(client):
+    assert client.dislike_playlists([]) == {}
+    assert StubHandler.sent == []
+
+
+if __name__ == '__main__':
+    pytest.main()
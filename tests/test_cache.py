@@ -0,0 +1,110 @@
+import time
+
+import pytest
+
+from soundcld.cache import MemoryCache, SQLiteCache
+
+API = 'https://api-v2.soundcloud.com'
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache(request, tmp_path):
+    if request.param == 'memory':
+        yield MemoryCache(ttls={'/search': 60}, default_ttl=60)
+    else:
+        disk = SQLiteCache(str(tmp_path / 'cache.db'), ttls={'/search': 60}, default_ttl=60)
+        yield disk
+        disk.close()
+
+
+def test_key_ignores_client_id_and_param_order(cache):
+    cache.set(f'{API}/search', {'q': 'a', 'limit': 20, 'client_id': 'x'}, {'collection': [1]})
+    assert cache.get(f'{API}/search', {'limit': 20, 'q': 'a', 'client_id': 'y'}) == {'collection': [1]}
+    assert cache.get(f'{API}/search', {'q': 'b', 'limit': 20}) is None
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+
+
+def test_returned_response_is_a_copy(cache):
+    cache.set(f'{API}/users/1', {}, {'id': 1, 'tags': ['a']})
+    cache.get(f'{API}/users/1', {})['tags'].append('b')
+    assert cache.get(f'{API}/users/1', {}) == {'id': 1, 'tags': ['a']}
+
+
+def test_uncached_paths_are_not_looked_up(cache):
+    assert cache.get(f'{API}/me', {}) is None
+    cache.ttls = []
+    cache.default_ttl = 0
+    assert cache.get(f'{API}/users/1', {}) is None
+    assert cache.stats() == {'hits': 0, 'misses': 0}
+
+
+def test_ttl_per_path(cache):
+    cache.set(f'{API}/me/track_likes/ids', {}, {'collection': [1]})
+    assert cache.get(f'{API}/me/track_likes/ids', {}) is None
+    cache.default_ttl = 0.01
+    cache.set(f'{API}/users/1', {}, {'id': 1})
+    time.sleep(0.05)
+    assert cache.get(f'{API}/users/1', {}) is None
+
+
+def test_unlisted_and_private_paths_are_not_cached():
+    cache = MemoryCache(ttls={'/me/*': 60, '/users/{id}/conversations': 60})
+    assert MemoryCache().ttl_for('/stream/users/1') == 0
+    assert MemoryCache().ttl_for('/users/1/likes') > 0
+    for path in ('/me', '/me/track_likes/ids', '/users/1/conversations', '/users/1/conversations/2/messages'):
+        cache.set(f'{API}{path}', {}, {'collection': []})
+        assert cache.get(f'{API}{path}', {}) is None
+
+
+def test_invalidate_resource_children_and_parents(cache):
+    cache.set(f'{API}/users/1', {}, {'id': 1})
+    cache.set(f'{API}/users/1/likes', {'limit': 24}, {'collection': []})
+    cache.set(f'{API}/users/2', {}, {'id': 2})
+    cache.set(f'{API}/users/1_0', {}, {'id': 10})
+    cache.invalidate(f'{API}/users/1/likes/5')
+    assert cache.get(f'{API}/users/1', {}) is None
+    assert cache.get(f'{API}/users/1/likes', {'limit': 24}) is None
+    assert cache.get(f'{API}/users/2', {}) == {'id': 2}
+    cache.invalidate(f'{API}/users/1')
+    assert cache.get(f'{API}/users/1_0', {}) == {'id': 10}
+
+
+def test_invalidate_follows_mutation_rules(cache):
+    affected = [
+        (f'{API}/users/7/track_likes', {'limit': 200}),
+        (f'{API}/users/7/likes', {'limit': 24}),
+        (f'{API}/tracks/5', {}),
+        (f'{API}/tracks/5/likers', {}),
+    ]
+    kept = [
+        (f'{API}/users/8/likes', {'limit': 24}),
+        (f'{API}/tracks/6', {}),
+        (f'{API}/playlists/5', {}),
+    ]
+    for url, params in affected + kept:
+        cache.set(url, params, {'url': url})
+    cache.invalidate(f'{API}/users/7/track_likes/5')
+    assert [cache.get(url, params) for url, params in affected] == [None] * len(affected)
+    assert [cache.get(url, params) for url, params in kept] == [{'url': url} for url, _ in kept]
+
+
+def test_memory_cache_is_bounded():
+    cache = MemoryCache(maxsize=2, default_ttl=60)
+    for index in range(3):
+        cache.set(f'{API}/tracks/{index}', {}, {'id': index})
+    assert cache.get(f'{API}/tracks/0', {}) is None
+    assert cache.get(f'{API}/tracks/2', {}) == {'id': 2}
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    first = SQLiteCache(path)
+    first.set(f'{API}/tracks/1', {}, {'id': 1})
+    first.close()
+    second = SQLiteCache(path)
+    assert second.get(f'{API}/tracks/1', {}) == {'id': 1}
+    second.close()
+
+
+if __name__ == '__main__':
+    pytest.main()
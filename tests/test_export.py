@@ -0,0 +1,55 @@
+import gzip
+import json
+
+import pytest
+from helpers import Item, PagedReq, make_client
+from soundcld.export import export_jsonl
+
+
+class ExportReq(PagedReq):
+    """
+    PagedReq With Extra Field In Items
+    """
+    page_count = 4
+    extra = {'extra': 'x'}
+
+
+@pytest.fixture
+def client():
+    client = make_client(loaded=[], fail_page=None)
+    client.get_items = lambda **param: ExportReq(client, '/items', Item)(**param)
+    return client
+
+
+def read_lines(path):
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rb') as file:
+        return [json.loads(line) for line in file.read().splitlines()]
+
+
+@pytest.mark.parametrize('name', ['items.jsonl', 'items.jsonl.gz'])
+def test_export_resumes_after_interruption(client, tmp_path, name):
+    path = str(tmp_path / name)
+    client.fail_page = 2
+    with pytest.raises(ConnectionError):
+        export_jsonl(client.get_items, path)
+    state = json.loads((tmp_path / f'{name}.state').read_text())
+    assert state['pages'] == 2 and state['next_href'].endswith('?page=2')
+    result = export_jsonl(client.get_items, path)
+    assert result.done and result.count == 40
+    assert [item['id'] for item in read_lines(path)] == list(range(40))
+    assert client.loaded == [0, 1, 2, 3]
+    assert export_jsonl(client.get_items, path).count == 40
+    assert client.loaded == [0, 1, 2, 3]
+
+
+def test_export_decoded_and_restart(client, tmp_path):
+    path = str(tmp_path / 'items.jsonl')
+    export_jsonl(client.get_items, path)
+    result = export_jsonl(client.get_items, path, decode=True, resume=False)
+    assert result.count == 40 and result.pages == 4
+    assert read_lines(path)[:2] == [{'id': 0}, {'id': 1}]
+
+
+if __name__ == '__main__':
+    pytest.main()
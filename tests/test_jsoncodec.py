@@ -0,0 +1,42 @@
+import pytest
+
+from soundcld import jsoncodec
+from soundcld.jsoncodec import OrjsonCodec, StdlibCodec
+
+CODECS = [StdlibCodec]
+if jsoncodec.orjson is not None:
+    CODECS.append(OrjsonCodec)
+
+
+@pytest.fixture(params=CODECS)
+def codec(request):
+    return request.param()
+
+
+def test_codec_round_trip(codec):
+    value = {'title': 'Şəki — 東京', 'ids': [1, 2], 'public': True, 'genre': None}
+    data = codec.dumps(value)
+    assert isinstance(data, bytes)
+    assert b' ' not in data.replace('Şəki — 東京'.encode(), b'')
+    assert codec.loads(data) == value
+    assert codec.loads(data.decode('utf-8')) == value
+
+
+def test_codecs_agree(codec):
+    value = {'a': [1, 2.5, 'x'], 'b': {'c': None}}
+    assert codec.dumps(value) == StdlibCodec().dumps(value)
+
+
+def test_set_codec_by_name():
+    try:
+        assert jsoncodec.set_codec('json').name == 'json'
+        assert jsoncodec.loads(b'{"id":1}') == {'id': 1}
+        assert jsoncodec.dumps({'id': 1}) == b'{"id":1}'
+    finally:
+        jsoncodec.set_codec(None)
+    expected = 'orjson' if jsoncodec.orjson is not None else 'json'
+    assert jsoncodec.get_codec().name == expected
+
+
+if __name__ == '__main__':
+    pytest.main()
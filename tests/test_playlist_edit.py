@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from helpers import StubHandler
+from soundcld import AsyncSoundCloud, SoundCloud
+from soundcld.cache import MemoryCache
+
+
+@pytest.fixture
+def client(stub_server, config, capsys):
+    StubHandler.playlists[5] = (0, [1, 2, 3])
+    sound = SoundCloud(auth=True, lazy=True, api_base=stub_server, cache=MemoryCache())
+    yield sound
+    sound.close()
+    capsys.readouterr()
+
+
+def playlist_puts():
+    return [body for method, path, body in StubHandler.bodies if method == 'PUT' and path == '/playlists/5']
+
+
+def playlist_reads():
+    return [path for path in StubHandler.requests if path.startswith('/playlists/5?')]
+
+
+def test_edited_track_ids_is_linear_and_keeps_semantics():
+    ids = list(range(10)) + [3]
+    assert SoundCloud._edited_track_ids(ids, remove=[3, 4, 42]) == [0, 1, 2, 5, 6, 7, 8, 9, 3]
+    assert SoundCloud._edited_track_ids(ids, remove=3, add=[11]) == [0, 1, 2, 4, 5, 6, 7, 8, 9, 3, 11]
+    assert SoundCloud._edited_track_ids([1, 2, 3, 4], order=[4, 2, 9]) == [4, 2, 1, 3]
+
+
+def test_batch_edit_sends_one_put(client):
+    assert client.edit_playlist_tracks(5, add=[4, 5], remove=[2], order=[5])
+    assert playlist_puts() == [{'playlist': {'tracks': [5, 1, 3, 4]}}]
+    assert client.remove_track_from_playlist(5, [1, 3])
+    assert StubHandler.playlists[5] == (2, [5, 4])
+
+
+def test_edit_reads_playlist_past_response_cache(client):
+    assert client._get_raw('/playlists/5')['tracks'] == [{'id': 1}, {'id': 2}, {'id': 3}]
+    StubHandler.playlists[5] = (1, [1, 2, 3, 9])
+    assert client._get_playlist_state(5).track_ids == [1, 2, 3, 9]
+    assert client.add_track_to_playlist(5, 4)
+    assert StubHandler.playlists[5][1] == [1, 2, 3, 9, 4]
+    assert len(playlist_reads()) == 3
+
+
+def test_async_edit_keeps_changes_made_elsewhere(stub_server, config, capsys):
+    StubHandler.playlists[5] = (0, [1, 2, 3])
+    client = AsyncSoundCloud(auth=True, lazy=True, api_base=stub_server, cache=MemoryCache())
+
+    async def run():
+        async with client:
+            assert await client.add_track_to_playlist(5, 4)
+            StubHandler.playlists[5] = (5, [1, 2, 3, 4, 6])
+            assert await client.add_track_to_playlist(5, 7)
+
+    asyncio.run(run())
+    capsys.readouterr()
+    assert StubHandler.playlists[5][1] == [1, 2, 3, 4, 6, 7]
+    assert StubHandler.errors == []
+
+
+def test_edit_info_uses_raw_state(client):
+    client.edit_playlist_info(5, title='new', permalink='new')
+    payload = playlist_puts()[0]
+    assert payload['title'] == 'new' and payload['tracks'] == [1, 2, 3]
+    assert payload['permalink_url'] == 'https://soundcloud.com/me/sets/new'
+    assert payload['_resource_type'] == 'playlist'
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,88 @@
+import pytest
+import requests
+
+from helpers import StubHandler
+from soundcld import SoundCloud
+from soundcld.ratelimit import RateLimiter, TokenBucket
+from soundcld.request_handler import CollectionGetReq
+
+
+@pytest.fixture
+def make_limited(stub_server, config, capsys):
+    clients = []
+
+    def make(limiter):
+        clients.append(SoundCloud(lazy=True, api_base=stub_server, rate_limiter=limiter))
+        return clients[-1]
+
+    yield make
+    for client in clients:
+        client.close()
+    capsys.readouterr()
+
+
+def sent(method, path):
+    return StubHandler.sent.count((method, path))
+
+
+def test_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate=10, burst=2)
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_families_have_own_buckets():
+    limiter = RateLimiter(rate=100, burst=1, rates={'search': (1, 1)})
+    assert limiter.wait('https://api-v2.soundcloud.com/search/tracks?q=a') == 0
+    assert limiter.wait('https://api-v2.soundcloud.com/search?q=b') > 0.9
+    assert limiter.wait('https://api-v2.soundcloud.com/users/1') == 0
+
+
+def test_retries_throttled_and_failed_requests(make_limited):
+    limiter = RateLimiter(backoff=0.001)
+    client = make_limited(limiter)
+    StubHandler.statuses[('GET', '/tracks/1')] = [429, 0, 503]
+    assert client.get_track(1).id == 1
+    assert sent('GET', '/tracks/1') == 4
+    stats = limiter.stats()
+    assert stats['retried'] == 3 and stats['throttled'] == 1
+    assert stats['rates']['tracks'] < limiter.rate
+
+
+def test_post_is_not_retried_on_server_error(make_limited, stub_server):
+    client = make_limited(RateLimiter(backoff=0.001))
+    StubHandler.statuses[('POST', '/me/track_reposts/1')] = [502]
+    assert client._request('POST', f'{stub_server}/me/track_reposts/1').status_code == 502
+    assert sent('POST', '/me/track_reposts/1') == 1
+
+
+def test_retry_budget_stops_retry_storm(make_limited, stub_server):
+    limiter = RateLimiter(backoff=0.001, retries=10, max_budget=2, retry_ratio=0)
+    client = make_limited(limiter)
+    StubHandler.statuses[('GET', '/tracks/1')] = [500] * 10
+    assert client._request('GET', f'{stub_server}/tracks/1').status_code == 500
+    assert sent('GET', '/tracks/1') == 3
+    assert limiter.stats()['exhausted'] == 1
+
+
+def test_collection_raises_when_retries_run_out(make_limited):
+    client = make_limited(RateLimiter(backoff=0.001, retries=2))
+    StubHandler.pages['/users/1/followers'] = 2
+    StubHandler.statuses[('GET', '/users/1/followers')] = [None, 503, 503, 503]
+    items = CollectionGetReq(client, '/users/1/followers', dict, raw=True)(limit=1)
+    assert next(items) == {'id': 0}
+    with pytest.raises(requests.HTTPError):
+        next(items)
+    assert sent('GET', '/users/1/followers') == 4
+
+
+def test_retry_after_is_honored():
+    limiter = RateLimiter(backoff=5)
+    assert limiter.retry_delay('GET', '/tracks', 0, 429, '2') == 2
+    assert limiter.retry_delay('GET', '/tracks', 0, 200) is None
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from helpers import FakeResponse, Item, PagedReq, make_client
+from soundcld.async_request_handler import AsyncCollectionGetReq
+from soundcld.cache import PreflightCache
+from soundcld.request_handler import GetReq, PutReq, collection_options
+from soundcld.singleflight import SingleFlight
+
+
+@pytest.fixture
+def paged_client():
+    client = make_client(loaded=[])
+    return client
+
+@pytest.mark.parametrize('prefetch', [0, 1, 2, 8])
+def test_collection_prefetch_keeps_order(paged_client, prefetch):
+    req = PagedReq(paged_client, '/items', Item, prefetch=prefetch)
+    assert [item.id for item in req()] == list(range(50))
+    assert paged_client.loaded == [0, 1, 2, 3, 4]
+
+def test_collection_prefetch_uses_client_default(paged_client):
+    paged_client.prefetch = 2
+    req = PagedReq(paged_client, '/items', Item)
+    assert [item.id for item in req()] == list(range(50))
+
+def test_collection_prefetch_is_bounded_and_closes(paged_client):
+    req = PagedReq(paged_client, '/items', Item, prefetch=2)
+    items = req()
+    assert next(items).id == 0
+    threads = threading.active_count()
+    items.close()
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and thread.daemon:
+            thread.join(timeout=1)
+    assert len(paged_client.loaded) <= 4
+    assert threading.active_count() <= threads
+
+class AsyncPagedReq(AsyncCollectionGetReq):
+    """
+    AsyncCollectionGetReq Served From In-Memory Pages
+    """
+    page_count = 5
+    extra = {}
+
+    async def _load_href(self, url, param):
+        return PagedReq._load_href(self, url, param)
+
+
+def test_async_collection_prefetch_closes_loader(paged_client):
+    async def run():
+        req = AsyncPagedReq(paged_client, '/items', Item, prefetch=1)
+        items = req()
+        first = await items.__anext__()
+        await asyncio.sleep(0.01)
+        await items.aclose()
+        return first, asyncio.all_tasks() - {asyncio.current_task()}
+
+    first, pending = asyncio.run(run())
+    assert first.id == 0
+    assert pending == set()
+    assert len(paged_client.loaded) <= 3
+
+def test_collection_slotted_return_type(paged_client):
+    paged_client.slotted = True
+    req = PagedReq(paged_client, '/items', Item)
+    items = list(req())
+    assert len(items) == 50
+    assert not hasattr(items[0], '__dict__')
+    assert dict(items[0].items()) == {'id': 0}
+
+def test_collection_raw_items_skip_decoding(paged_client):
+    req = PagedReq(paged_client, '/items', Item, raw=True)
+    items = list(req())
+    assert items[:2] == [{'id': 0}, {'id': 1}] and len(items) == 50
+
+def test_collection_fields_yield_named_tuples(paged_client):
+    req = PagedReq(paged_client, '/items', Item, fields=('id', 'user_id'))
+    first = next(req())
+    assert first == (0, None)
+    assert first.id == 0 and first._fields == ('id', 'user_id')
+
+def test_collection_options_apply_inside_context_only(paged_client):
+    with collection_options(fields='id'):
+        projected = PagedReq(paged_client, '/items', Item)
+        explicit = PagedReq(paged_client, '/items', Item, fields=(), raw=False)
+    decoded = PagedReq(paged_client, '/items', Item)
+    assert next(projected()).id == 0 and isinstance(next(projected()), tuple)
+    assert isinstance(next(explicit()), Item)
+    assert isinstance(next(decoded()), Item)
+
+class SlowReq(GetReq):
+    """
+    GetReq Served After Delay, Counting Network Calls
+    """
+
+    def _fetch(self, url, params):
+        self.client.loaded.append(url)
+        time.sleep(0.2)
+        return {'id': int(url.rsplit('/', 1)[1])}
+
+def test_concurrent_identical_gets_are_coalesced():
+    client = make_client(loaded=[], inflight=SingleFlight())
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker(track_id):
+        barrier.wait()
+        results.append(SlowReq(client, f'/tracks/{track_id}', Item)())
+
+    threads = [threading.Thread(target=worker, args=(i % 2,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(item.id for item in results) == [0] * 4 + [1] * 4
+    assert len(client.loaded) == 2
+    assert client.inflight.stats() == {'calls': 4, 'saved': 6, 'in_flight': 0}
+
+def test_singleflight_shares_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError('boom')
+
+    def call(func):
+        try:
+            flight.do('key', func)
+        except ValueError as err:
+            errors.append(err)
+
+    leader = threading.Thread(target=call, args=(fail,))
+    leader.start()
+    started.wait()
+    call(lambda: 'unused')
+    leader.join()
+    assert len(errors) == 2 and errors[0] is errors[1]
+    assert flight.do('key', lambda: 'again') == 'again'
+
+def complex_client(*statuses):
+    client = make_client(cookies={'datadome': 'dd'}, headers={}, preflights=PreflightCache(60), sent=[])
+    statuses = list(statuses)
+
+    def request(method, url, **kwargs):
+        client.sent.append(method)
+        client.last = kwargs
+        return FakeResponse(statuses.pop(0) if method != 'OPTIONS' else 200)
+
+    client._request = request
+    return client
+
+def test_preflight_is_cached_per_url_template():
+    client = complex_client(200, 200)
+    PutReq(client, '/me/track_likes/1')()
+    PutReq(client, '/me/track_likes/2')()
+    assert client.sent == ['OPTIONS', 'PUT', 'PUT']
+    assert client.preflights.stats() == {'hits': 1, 'misses': 1}
+
+def test_payload_is_serialized_once():
+    client = complex_client(200)
+    PutReq(client, '/me')(username='şəki', city='Baku')
+    body = client.last['data']
+    assert body == '{"username":"şəki","city":"Baku"}'.encode('utf-8')
+    assert client.last['headers']['Content-Length'] == str(len(body))
+    assert client.last['headers']['Content-Type'] == 'application/json'
+    assert 'json' not in client.last
+
+def test_rejected_request_redoes_preflight():
+    client = complex_client(200, 403, 200)
+    PutReq(client, '/me/track_likes/1')()
+    PutReq(client, '/me/track_likes/2')()
+    assert client.sent == ['OPTIONS', 'PUT', 'PUT', 'OPTIONS', 'PUT']
+
+if __name__ == '__main__':
+    pytest.main()
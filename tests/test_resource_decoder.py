@@ -0,0 +1,209 @@
+import copy
+import json
+import os
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+
+import dateutil.parser
+import pytest
+from dacite import MissingValueError, WrongTypeError, from_dict
+from soundcld.request_handler import _convert_dict
+from soundcld.resource import (
+    SearchItem, Like, StreamItem,
+    TrackLike, TrackStreamItem,
+    BasicTrack, Track,
+    BasicUser, Comment,
+    Message, MissingUser
+)
+from soundcld.resource.datetimes import parse_datetime
+from soundcld.resource.track import CommentTrack
+from soundcld.resource.decoder import compile_union
+from soundcld.resource.identity import IdentityMap
+from soundcld.resource.lazy import lazy, lazy_type
+from soundcld.resource.slotted import (
+    SlottedBasicTrack, SlottedBaseTrack, SlottedBasicUser,
+    SlottedSearchItem
+)
+
+
+@pytest.fixture
+def tracks_page():
+    path = os.path.join(os.path.dirname(__file__), 'data', 'tracks_page.json')
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)['collection']
+
+def test_decoder_matches_dacite(tracks_page):
+    for item in tracks_page:
+        expected = from_dict(BasicTrack, item, BasicTrack.dacite_config)
+        assert BasicTrack.from_dict(item) == expected
+
+def test_decoder_keeps_missing_value_error(tracks_page):
+    with pytest.raises(MissingValueError) as err:
+        Track.from_dict(tracks_page[0])
+    assert err.value.field_path == 'user.created_at'
+    item = copy.deepcopy(tracks_page[0])
+    del item['user']['badges']['pro']
+    with pytest.raises(MissingValueError) as err:
+        BasicTrack.from_dict(item)
+    assert err.value.field_path == 'user.badges.pro'
+
+def test_decoder_optional_and_none(tracks_page):
+    item = copy.deepcopy(tracks_page[0])
+    del item['genre']
+    assert BasicTrack.from_dict(item).genre is None
+    item['duration'] = None
+    with pytest.raises(WrongTypeError):
+        BasicTrack.from_dict(item)
+
+def test_decoder_union_falls_back(tracks_page):
+    message = {
+        'content': 'hi',
+        'conversation_id': '1:2',
+        'sender': {'id': 1, 'kind': 'user'},
+        'sender_urn': 'soundcloud:users:1',
+        'sender_type': 'user',
+        'sent_at': '2024-01-02T03:04:05Z'
+    }
+    assert isinstance(Message.from_dict(message).sender, MissingUser)
+    message['sender'] = tracks_page[0]['user']
+    assert Message.from_dict(message) == from_dict(Message, message, Message.dacite_config)
+
+def test_union_dispatch_decodes_once(tracks_page):
+    index = compile_union(SearchItem)
+    before = index.stats()
+    items = [_convert_dict(item, SearchItem) for item in tracks_page]
+    items.append(_convert_dict(tracks_page[0]['user'], SearchItem))
+    assert all(isinstance(item, BasicTrack) for item in items[:-1])
+    assert isinstance(items[-1], BasicUser)
+    after = index.stats()
+    assert after['dispatched'] - before['dispatched'] == len(items)
+    assert after['fallbacks'] == before['fallbacks']
+
+def test_union_dispatch_by_type_and_keys(tracks_page):
+    like = {'created_at': '2024-01-02T03:04:05Z', 'kind': 'like', 'track': tracks_page[0]}
+    assert isinstance(_convert_dict(like, Like), TrackLike)
+    stream = {
+        'created_at': '2024-01-02T03:04:05Z',
+        'type': 'track',
+        'user': tracks_page[0]['user'],
+        'uuid': 'uuid',
+        'caption': None,
+        'track': tracks_page[0]
+    }
+    assert isinstance(_convert_dict(stream, StreamItem), TrackStreamItem)
+    assert _convert_dict({'kind': 'unknown'}, SearchItem) is None
+    assert compile_union(SearchItem).stats()['failures'] >= 1
+
+def test_slotted_variants_keep_api(tracks_page):
+    for item in tracks_page:
+        slotted = SlottedBasicTrack.from_dict(item)
+        plain = BasicTrack.from_dict(item)
+        assert not hasattr(slotted, '__dict__')
+        assert isinstance(slotted, SlottedBaseTrack)
+        assert isinstance(slotted.user, SlottedBasicUser)
+        assert dict(slotted.items()) == dict(plain.items())
+        assert slotted['title'] == plain['title']
+    assert isinstance(_convert_dict(tracks_page[0], SlottedSearchItem), SlottedBasicTrack)
+
+def test_lazy_variants_decode_on_access(tracks_page):
+    for item in tracks_page:
+        track = lazy(BasicTrack).from_dict(item)
+        plain = BasicTrack.from_dict(item)
+        assert isinstance(track, BasicTrack)
+        assert 'user' not in vars(track) and 'created_at' not in vars(track)
+        assert track.user is track.user and isinstance(track.user, BasicUser)
+        assert track['created_at'] == plain.created_at
+        assert dict(track.items()) == dict(plain.items())
+    assert lazy(SlottedBasicTrack) is SlottedBasicTrack
+    assert type(_convert_dict(tracks_page[0], lazy_type(SearchItem))) is lazy(BasicTrack)
+
+def test_lazy_variants_defer_errors(tracks_page):
+    item = copy.deepcopy(tracks_page[0])
+    del item['user']['badges']['pro']
+    item['duration'] = None
+    track = lazy(BasicTrack).from_dict(item)
+    with pytest.raises(MissingValueError) as err:
+        track.user.badges
+    assert err.value.field_path == 'badges.pro'
+    with pytest.raises(WrongTypeError):
+        track.duration
+    del item['id']
+    with pytest.raises(MissingValueError):
+        lazy(BasicTrack).from_dict(item)
+
+def test_lazy_nested_comment_track(tracks_page):
+    comment = {
+        'kind': 'comment', 'id': 1, 'body': 'hi', 'created_at': '2024-01-02T03:04:05Z',
+        'timestamp': 0, 'track_id': tracks_page[0]['id'], 'user_id': 1,
+        'self': {'urn': 'soundcloud:comments:1'},
+        'user': tracks_page[0]['user'], 'track': tracks_page[0]
+    }
+    decoded = _convert_dict(comment, lazy(Comment))
+    assert 'track' not in vars(decoded)
+    assert type(decoded.track) is lazy(CommentTrack)
+    assert type(decoded.track.user) is lazy(BasicUser)
+    assert dict(decoded.items()) == dict(Comment.from_dict(comment).items())
+
+def generic_dict(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return {field.name: generic_dict(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, (list, tuple)):
+        return [generic_dict(item) for item in value]
+    return value
+
+def test_to_dict_matches_generic_conversion(tracks_page):
+    for item in tracks_page:
+        plain = BasicTrack.from_dict(item)
+        expected = generic_dict(plain)
+        assert dict(plain.items()) == expected
+        for track in (plain, SlottedBasicTrack.from_dict(item), lazy(BasicTrack).from_dict(item)):
+            data = track.to_dict()
+            assert data == expected
+            assert json.loads(track.to_json()) == data
+
+def test_to_dict_skips_none(tracks_page):
+    item = copy.deepcopy(tracks_page[0])
+    item['genre'] = None
+    data = BasicTrack.from_dict(item).to_dict(skip_none=True)
+    assert 'genre' not in data
+    assert None not in data.values()
+    assert all(value is not None for value in data['user'].values())
+
+def test_identity_map_interns_users(tracks_page):
+    identity_map = IdentityMap(maxsize=100)
+    tracks = [_convert_dict(item, BasicTrack, identity_map) for item in tracks_page]
+    users = {item['user']['id'] for item in tracks_page}
+    assert len({id(track.user) for track in tracks}) == len(users)
+    assert tracks == [BasicTrack.from_dict(item) for item in tracks_page]
+    stats = identity_map.stats()
+    assert stats['hits'] >= len(tracks_page) - len(users)
+    assert stats['size'] <= 100
+
+def test_identity_map_is_bounded(tracks_page):
+    identity_map = IdentityMap(maxsize=2)
+    for item in tracks_page:
+        _convert_dict(item, BasicTrack, identity_map)
+    assert identity_map.stats()['size'] == 2
+    assert BasicTrack.from_dict(tracks_page[0]).user is not BasicTrack.from_dict(tracks_page[0]).user
+
+@pytest.mark.parametrize('value', [
+    '2024-01-02T03:04:05Z',
+    '1999-12-31T23:59:59Z',
+    '2024-01-02T03:04:05.123Z',
+    '2024-01-02T03:04:05+02:00',
+    '2024-01-02'
+])
+def test_parse_datetime_matches_dateutil(value):
+    expected = dateutil.parser.isoparse(value)
+    assert parse_datetime(value) == expected
+    assert parse_datetime(value).utcoffset() == expected.utcoffset()
+    assert parse_datetime(value).isoformat() == expected.isoformat()
+
+def test_parse_datetime_rejects_invalid():
+    with pytest.raises(ValueError):
+        parse_datetime('2024-02-30T03:04:05Z')
+
+if __name__ == '__main__':
+    pytest.main()
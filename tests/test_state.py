@@ -0,0 +1,71 @@
+import json
+import threading
+import time
+
+import pytest
+
+from soundcld import SoundCloud
+from soundcld.state import StateStore
+
+
+def test_updates_are_coalesced_into_one_atomic_write(tmp_path):
+    path = tmp_path / 'cookies.json'
+    store = StateStore(str(path), flush_interval=0.05)
+    for index in range(50):
+        store.update({'datadome': f'dd-{index}'})
+    assert not path.exists()
+    assert store.load() == {'datadome': 'dd-49'}
+    time.sleep(0.3)
+    assert json.loads(path.read_text()) == {'datadome': 'dd-49'}
+    assert store.writes == 1
+    store.update({'datadome': 'dd-49'})
+    store.flush()
+    assert store.writes == 1
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_concurrent_writers_keep_each_others_keys(tmp_path):
+    path = str(tmp_path / 'data.json')
+
+    def writer(name):
+        store = StateStore(path, flush_interval=0)
+        for index in range(20):
+            store.update({name: index})
+
+    threads = [threading.Thread(target=writer, args=(f'key{i}',)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with open(path, 'r', encoding='utf-8') as file:
+        assert json.load(file) == {f'key{i}': 19 for i in range(6)}
+
+
+def test_client_keeps_state_in_state_dir(tmp_path):
+    state_dir = tmp_path / 'state'
+    client = SoundCloud(auth=True, lazy=True, state_dir=str(state_dir))
+    assert json.loads((state_dir / 'data.json').read_text())['client_id'] is None
+    assert json.loads((state_dir / 'cookies.json').read_text())['oauth_token'] is None
+    client.generate_client_id = lambda: client.data.update(client_id='client')
+    assert client._refresh_client_id(None)
+    client._mark_logged_in()
+    client.close()
+    saved = json.loads((state_dir / 'data.json').read_text())
+    assert saved['client_id'] == 'client' and 'last_validate' in saved
+
+
+def test_login_check_does_not_write_back_stale_client_id(tmp_path):
+    state_dir = str(tmp_path / 'state')
+    first = SoundCloud(lazy=True, state_dir=state_dir)
+    second = SoundCloud(lazy=True, state_dir=state_dir)
+    first.generate_client_id = lambda: first.data.update(client_id='fresh')
+    assert first._refresh_client_id(None)
+    first.close()
+    second._mark_logged_in()
+    second.close()
+    saved = json.loads((tmp_path / 'state' / 'data.json').read_text())
+    assert saved['client_id'] == 'fresh' and 'last_validate' in saved
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,128 @@
+import json
+import random
+import threading
+import time
+
+import pytest
+import requests
+
+import soundcld.api_handler
+from helpers import StubHandler
+from soundcld import SoundCloud
+from soundcld.resource import BasicTrack
+
+@pytest.fixture
+def client(stub_server, config):
+    sound = SoundCloud(auth=True, api_base=stub_server, pool_maxsize=16)
+    yield sound
+    sound.close()
+
+
+def test_repeated_calls_reuse_one_session_and_connection(stub_server, config, monkeypatch):
+    sessions = []
+
+    class RecordedSession(requests.Session):
+        def __init__(self):
+            super().__init__()
+            sessions.append(self)
+
+    monkeypatch.setattr(soundcld.api_handler.requests, 'Session', RecordedSession)
+    client = SoundCloud(api_base=stub_server)
+    start = len(StubHandler.peers)
+    tracks = [client.get_track(track_id) for track_id in range(1, 11)]
+    assert [track.id for track in tracks] == list(range(1, 11))
+    assert sessions == [client.session]
+    assert len(set(StubHandler.peers[start:])) == 1
+    assert len(client.session.get_adapter(stub_server).poolmanager.pools) == 1
+    client.close()
+
+
+def test_session_jar_does_not_resend_server_cookies(stub_server, config):
+    StubHandler.set_cookie = 'datadome=fromserver; Path=/'
+    anonymous = SoundCloud(lazy=True, api_base=stub_server)
+    for track_id in range(1, 4):
+        anonymous.get_track(track_id)
+    assert len(anonymous.session.cookies) == 0
+    assert StubHandler.cookies == [None] * 3
+    anonymous.close()
+    client = SoundCloud(auth=True, lazy=True, api_base=stub_server)
+    for track_id in range(1, 4):
+        client.get_track(track_id)
+    assert len(client.session.cookies) == 0
+    assert StubHandler.cookies[-1].count('datadome=') == 1
+    assert client.cookies['datadome'] == 'fromserver'
+    client.close()
+
+
+def test_shared_client_under_concurrent_reads_and_writes(client, capsys):
+    headers = dict(client.headers)
+    failures = []
+
+    def worker(seed):
+        rand = random.Random(seed)
+        for _ in range(30):
+            track_id = rand.randrange(1, 50)
+            operation = rand.choice(['get', 'get', 'like', 'dislike'])
+            try:
+                if operation == 'get':
+                    track = client.get_track(track_id)
+                    assert isinstance(track, BasicTrack) and track.id == track_id
+                elif operation == 'like':
+                    assert client.like_track(track_id) is True
+                else:
+                    assert client.dislike_track(track_id) is True
+            except Exception as err:  # pylint: disable=broad-except
+                failures.append(repr(err))
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    capsys.readouterr()
+    assert failures == []
+    assert StubHandler.errors == []
+    assert client.headers == headers
+    assert client.cookies['datadome'].startswith('dd-') and client.cookies['datadome'] != 'dd-0'
+
+
+def test_lazy_client_regenerates_rejected_client_id_once(stub_server, config, capsys):
+    config.write_text(json.dumps({'user_id': 'user', 'client_id': 'stale', 'app_version': '1'}))
+    client = SoundCloud(api_base=stub_server, lazy=True)
+    assert StubHandler.requests == []
+    generated = []
+
+    def generate_client_id():
+        generated.append(client.data['client_id'])
+        client.data['client_id'] = 'fresh'
+
+    client.generate_client_id = generate_client_id
+    threads = [threading.Thread(target=client.get_track, args=(track_id,)) for track_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    capsys.readouterr()
+    assert generated == ['stale']
+    assert client.get_track(3).id == 3
+    client.close()
+    assert json.loads(config.read_text())['client_id'] == 'fresh'
+
+def test_login_validation_is_cached_in_memory_and_written_behind(stub_server, config):
+    client = SoundCloud(auth=True, api_base=stub_server, lazy=True, write_delay=0.05)
+    written = config.read_text()
+    assert all(client.is_logged_in() for _ in range(20))
+    probes = [path for path in StubHandler.requests if '/conversations' in path]
+    assert len(probes) == 1
+    assert config.read_text() == written
+    time.sleep(0.3)
+    assert 'last_validate' in json.loads(config.read_text())
+    assert [path.name for path in config.parent.iterdir() if path.suffix == '.tmp'] == []
+    client.close()
+    other = SoundCloud(auth=True, api_base=stub_server, lazy=True)
+    assert other.is_logged_in()
+    assert len([path for path in StubHandler.requests if '/conversations' in path]) == 1
+    other.close()
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+import pytest
+
+from helpers import PAGE, StubHandler
+from soundcld import AsyncSoundCloud, SoundCloud
+from soundcld.cache import MemoryCache
+from soundcld.resource import BasicTrack, MiniTrack
+from soundcld.resource.base import BaseData
+
+
+@pytest.fixture
+def client(stub_server, config, capsys):
+    sound = SoundCloud(lazy=True, api_base=stub_server)
+    yield sound
+    sound.close()
+    capsys.readouterr()
+
+
+def batches():
+    return [
+        [int(i) for i in path.split('ids=')[1].split('&')[0].split('%2C')]
+        for path in StubHandler.requests if path.startswith('/tracks?')
+    ]
+
+
+def test_get_tracks_batches_in_input_order(client):
+    StubHandler.deleted = {7, 120}
+    StubHandler.delay = 0.02
+    client.max_workers = 3
+    ids = list(range(200, 0, -1))
+    tracks = client.get_tracks(ids)
+    assert [track.id for track in tracks] == [i for i in ids if i not in (7, 120)]
+    assert tracks.missing == [120, 7]
+    assert sorted(len(batch) for batch in batches()) == [50, 50, 50, 50]
+    assert 1 < StubHandler.peak <= 3
+
+
+def test_get_tracks_keeps_failed_batches_apart_from_missing(client):
+    StubHandler.deleted = {2}
+    StubHandler.statuses[('GET', '/tracks')] = [None, 500, None]
+    tracks = client.get_tracks([1, 2, 3, 4, 5], batch_size=2, max_workers=1)
+    assert [track.id for track in tracks] == [1, 5]
+    assert tracks.missing == [2]
+    assert tracks.failed == [3, 4]
+
+
+def test_async_get_tracks_keeps_failed_batches_apart_from_missing(stub_server, config, capsys):
+    StubHandler.deleted = {2}
+    StubHandler.statuses[('GET', '/tracks')] = [None, 500, None]
+    client = AsyncSoundCloud(lazy=True, api_base=stub_server, batch_size=2, max_workers=1)
+
+    async def run():
+        async with client:
+            return await client.get_tracks([1, 2, 3, 4, 5])
+
+    tracks = asyncio.run(run())
+    capsys.readouterr()
+    assert [track.id for track in tracks] == [1, 5]
+    assert tracks.missing == [2]
+    assert tracks.failed == [3, 4]
+
+
+def test_get_tracks_arguments_override_client_defaults(client):
+    StubHandler.delay = 0.02
+    tracks = client.get_tracks([1, 2, 2, 3], batch_size=2, max_workers=1)
+    assert [track.id for track in tracks] == [1, 2, 2, 3]
+    assert batches() == [[1, 2], [3]]
+    assert StubHandler.peak == 1
+
+
+@dataclass
+class Playlist(BaseData):
+    """
+    Minimal Playlist For Offline Tests
+    """
+    id: int
+    tracks: Tuple[Union[BasicTrack, MiniTrack], ...]
+
+
+@pytest.fixture
+def raw_tracks():
+    with open(PAGE, 'r', encoding='utf-8') as file:
+        return json.load(file)['collection']
+
+
+def stub(track):
+    return {'id': track['id'], 'kind': 'track', 'monetization_model': 'NOT_APPLICABLE', 'policy': 'ALLOW'}
+
+
+def test_hydrate_playlists_dedupes_and_keeps_order(client, raw_tracks):
+    first = Playlist.from_dict({'id': 1, 'tracks': [raw_tracks[0]] + [stub(t) for t in raw_tracks[1:6]]})
+    second = Playlist.from_dict({'id': 2, 'tracks': [stub(t) for t in raw_tracks[4:8]] + [stub(raw_tracks[0])]})
+    StubHandler.deleted = {raw_tracks[7]['id']}
+    hydrated = client.hydrate_playlist([first, second], batch_size=3)
+    assert [track.id for track in hydrated[0].tracks] == [t['id'] for t in raw_tracks[:6]]
+    assert [track.id for track in hydrated[1].tracks] == [t['id'] for t in raw_tracks[4:8]] + [raw_tracks[0]['id']]
+    assert all(isinstance(track, BasicTrack) for track in hydrated[0].tracks)
+    assert isinstance(hydrated[1].tracks[3], MiniTrack)
+    assert hydrated[1].tracks[4] is first.tracks[0]
+    assert sorted(sum(batches(), [])) == sorted(t['id'] for t in raw_tracks[1:8])
+    assert isinstance(first.tracks[1], MiniTrack)
+
+
+def test_hydrate_playlist_reuses_cached_tracks(client, raw_tracks):
+    client.cache = MemoryCache()
+    assert client.get_track(raw_tracks[1]['id']).id == raw_tracks[1]['id']
+    playlist = Playlist.from_dict({'id': 1, 'tracks': [stub(t) for t in raw_tracks[:3]]})
+    hydrated = client.hydrate_playlist(playlist)
+    assert batches() == [[raw_tracks[0]['id'], raw_tracks[2]['id']]]
+    assert isinstance(hydrated.tracks[1], BasicTrack)
+    assert hydrated.tracks[1].id == raw_tracks[1]['id']
+
+
+if __name__ == '__main__':
+    pytest.main()